@@ -11,6 +11,7 @@ Features:
 - Installed via pyproject.toml
 """
 
+import asyncio
 import sys
 import os
 import json
@@ -20,6 +21,7 @@ import subprocess
 import warnings
 from datetime import datetime
 from pathlib import Path
+from stat import S_ISREG
 from typing import Optional, Dict, Any, List
 
 # Suppress pip warnings
@@ -201,12 +203,8 @@ def generate_content_id(platform: str = "content") -> str:
     return f"{platform}_{timestamp}_{unique_hash}"
 
 
-def get_file_info(file_path: Path) -> Optional[Dict[str, Any]]:
-    """Get file information"""
-    if not file_path.exists() or not file_path.is_file():
-        return None
-    
-    stat = file_path.stat()
+def _file_info_from_stat(file_path: Path, stat: os.stat_result) -> Dict[str, Any]:
+    """Build file information from an existing stat result"""
     return {
         "name": file_path.name,
         "path": str(file_path),
@@ -218,16 +216,31 @@ def get_file_info(file_path: Path) -> Optional[Dict[str, Any]]:
     }
 
 
+def get_file_info(file_path: Path) -> Optional[Dict[str, Any]]:
+    """Get file information"""
+    try:
+        stat = file_path.stat()
+    except OSError:
+        return None
+    if not S_ISREG(stat.st_mode):
+        return None
+    return _file_info_from_stat(file_path, stat)
+
+
 def get_all_downloads() -> List[Dict[str, Any]]:
-    """Get all downloaded files"""
-    files = []
-    if Config.DOWNLOADS_DIR.exists():
-        for f in sorted(Config.DOWNLOADS_DIR.iterdir(), key=lambda x: x.stat().st_mtime, reverse=True):
-            if f.is_file():
-                info = get_file_info(f)
-                if info:
-                    files.append(info)
-    return files
+    """Get all downloaded files, newest first"""
+    entries = []
+    try:
+        # scandir caches each entry's stat, so every file is stat'ed once
+        with os.scandir(Config.DOWNLOADS_DIR) as it:
+            for entry in it:
+                if entry.is_file():
+                    entries.append((entry.stat(), entry.path))
+    except FileNotFoundError:
+        return []
+    
+    entries.sort(key=lambda item: item[0].st_mtime, reverse=True)
+    return [_file_info_from_stat(Path(path), stat) for stat, path in entries]
 
 
 # ============================================================================
@@ -252,7 +265,7 @@ async def health_check():
 
 
 @app.get("/api/info")
-async def get_video_info(url: str):
+async def get_video_info(url: str, nocache: bool = False):
     """Get video information"""
     if not downloader.is_supported(url):
         raise HTTPException(
@@ -264,7 +277,7 @@ async def get_video_info(url: str):
     content_id = generate_content_id(platform.value)
     
     try:
-        info = downloader.get_video_info(url)
+        info = downloader.get_video_info(url, use_cache=not nocache)
         return {
             "content_id": content_id,
             "user_link": url,
@@ -302,13 +315,16 @@ async def download_video(
     content_id = generate_content_id(platform.value)
     
     try:
-        info = downloader.get_video_info(url)
+        # yt-dlp blocks, so run it in a worker thread; concurrent download
+        # requests then proceed in parallel instead of queueing on the loop
+        info = await asyncio.to_thread(downloader.get_video_info, url)
         
         # Use content ID as filename
         unique_filename = f"{content_id}.%(ext)s"
         output_template = str(Config.DOWNLOADS_DIR / unique_filename)
         
-        result = downloader.download(
+        result = await asyncio.to_thread(
+            downloader.download,
             url=url,
             quality=quality,
             format_name=format_name,
@@ -351,7 +367,7 @@ async def get_download_progress(task_id: str):
     
     return {
         "task_id": progress.task_id,
-        "status": progress.status.value,
+        "status": progress.status.name.lower(),
         "url": progress.url,
         "platform": progress.platform,
         "title": progress.title,
@@ -8,7 +8,7 @@ setup(
     author_email="dev@example.com",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
-    python_requires=">=3.8",
+    python_requires=">=3.9",
     install_requires=[
         "yt-dlp>=2024.1.1",
         "requests>=2.31.0",
@@ -26,9 +26,13 @@ setup(
         "python-dateutil>=2.8.2",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.9.0",
+        ],
         "dev": [
             "pytest>=7.4.0",
             "pytest-asyncio>=0.23.0",
+            "pytest-xdist>=3.5.0",
             "httpx>=0.26.0",
         ]
     },
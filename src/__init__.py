@@ -3,7 +3,15 @@
 __version__ = "1.0.0"
 __author__ = "Social Media Downloader Team"
 
-from .core.downloader import SocialMediaDownloader
-from .core.url_detector import detect_platform, Platform
+from .core.url_detector import detect_platform, detect_platforms, Platform
 
-__all__ = ["SocialMediaDownloader", "detect_platform", "Platform"]
+__all__ = ["SocialMediaDownloader", "detect_platform", "detect_platforms", "Platform"]
+
+
+def __getattr__(name):
+    # Imported on first use so that `import src...` does not load yt-dlp
+    if name == "SocialMediaDownloader":
+        from .core.downloader import SocialMediaDownloader
+
+        return SocialMediaDownloader
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
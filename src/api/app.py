@@ -8,10 +8,10 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, FileResponse
-from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
 from pathlib import Path
 
+from .responses import ZeroCopyStaticFiles
 from .routes import router
 from core.downloader import SocialMediaDownloader
 
@@ -54,7 +54,7 @@ app.add_middleware(
 
 # Mount static files directory for serving downloads
 if DOWNLOADS_DIR.exists():
-    app.mount("/files", StaticFiles(directory=str(DOWNLOADS_DIR)), name="files")
+    app.mount("/files", ZeroCopyStaticFiles(directory=str(DOWNLOADS_DIR)), name="files")
     print(f"Static files mounted at /files -> {DOWNLOADS_DIR}")
 
 # Include API routes
@@ -0,0 +1,85 @@
+"""File responses that hand the open file to the server when possible"""
+
+import os
+
+from fastapi.responses import FileResponse
+from fastapi.staticfiles import StaticFiles
+from starlette.staticfiles import NotModifiedResponse
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+ZEROCOPY_EXTENSION = "http.response.zerocopysend"
+
+
+class ZeroCopyFileResponse(FileResponse):
+    """
+    FileResponse using the ASGI zero-copy send extension
+
+    When the server advertises ``http.response.zerocopysend`` the opened
+    file is passed to it so the body can be sent with sendfile() instead
+    of being read into Python in chunks. Range
+    requests, HEAD requests and servers without the extension fall back
+    to the regular FileResponse (which already uses pathsend if offered).
+    """
+
+    def _can_zerocopy(self, scope: Scope) -> bool:
+        if ZEROCOPY_EXTENSION not in scope.get("extensions", {}):
+            return False
+        if scope.get("method") != "GET" or self.status_code != 200:
+            return False
+        return "range" not in Headers(scope=scope)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self._can_zerocopy(scope):
+            await super().__call__(scope, receive, send)
+            return
+
+        try:
+            file = open(self.path, "rb")
+        except OSError:
+            # Let FileResponse report the missing/unreadable file
+            await super().__call__(scope, receive, send)
+            return
+
+        with file:
+            stat_result = os.fstat(file.fileno())
+            if self.stat_result is None:
+                self.set_stat_headers(stat_result)
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": self.status_code,
+                    "headers": self.raw_headers,
+                }
+            )
+            # The extension takes a file object backed by an OS descriptor
+            await send(
+                {
+                    "type": ZEROCOPY_EXTENSION,
+                    "file": file,
+                    "count": stat_result.st_size,
+                    "more_body": False,
+                }
+            )
+
+        if self.background is not None:
+            await self.background()
+
+
+class ZeroCopyStaticFiles(StaticFiles):
+    """StaticFiles serving files through ZeroCopyFileResponse"""
+
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        response = ZeroCopyFileResponse(
+            full_path, status_code=status_code, stat_result=stat_result
+        )
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            return NotModifiedResponse(response.headers)
+        return response
@@ -1,14 +1,19 @@
 """API routes for the downloader service"""
 
-from typing import Optional
+import asyncio
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 from fastapi import APIRouter, HTTPException, Query, Request
-from fastapi.responses import FileResponse
+from fastapi.responses import Response
+from pydantic import TypeAdapter
 from datetime import datetime
 from pathlib import Path
 import urllib.parse
 
 import sys
 import os
+import json
+import time
 
 # Calculate project root from this file's location
 PROJECT_ROOT = Path(__file__).parent.parent.parent
@@ -17,6 +22,7 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 from core.downloader import SocialMediaDownloader
 from core.url_detector import detect_platform, Platform
+from .responses import ZeroCopyFileResponse
 from .models import (
     DownloadRequest,
     BatchDownloadRequest,
@@ -46,6 +52,40 @@ def get_downloader() -> SocialMediaDownloader:
     return _downloader
 
 
+# Serialized JSON bodies of read-only endpoints: key -> (expires_at, body)
+_RESPONSE_CACHE_TTL = 300
+_RESPONSE_CACHE_MAXSIZE = 512
+_response_cache: "OrderedDict[tuple, Tuple[float, bytes]]" = OrderedDict()
+
+_QUALITY_LIST = TypeAdapter(List[QualityOptionResponse])
+
+
+def _json_response(body: bytes) -> Response:
+    return Response(content=body, media_type="application/json")
+
+
+def _cached_response(key: tuple) -> Optional[Response]:
+    """Return the cached JSON response for key, if present and fresh"""
+    entry = _response_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, body = entry
+    if expires_at < time.monotonic():
+        _response_cache.pop(key, None)
+        return None
+    _response_cache.move_to_end(key)
+    return _json_response(body)
+
+
+def _cache_response(key: tuple, body: bytes) -> Response:
+    """Store a serialized JSON body and return it as a response"""
+    _response_cache[key] = (time.monotonic() + _RESPONSE_CACHE_TTL, body)
+    _response_cache.move_to_end(key)
+    while len(_response_cache) > _RESPONSE_CACHE_MAXSIZE:
+        _response_cache.popitem(last=False)
+    return _json_response(body)
+
+
 def get_file_url(request: Request, filename: str) -> str:
     """Generate full file URL for a downloaded file"""
     base_url = str(request.base_url).rstrip("/")
@@ -65,7 +105,10 @@ async def health_check():
 
 
 @router.get("/info", response_model=VideoInfoResponse, tags=["Info"])
-async def get_video_info(url: str = Query(..., description="Video URL")):
+async def get_video_info(
+    url: str = Query(..., description="Video URL"),
+    nocache: bool = Query(False, description="Bypass the metadata cache"),
+):
     """
     Get video metadata information
 
@@ -81,7 +124,10 @@ async def get_video_info(url: str = Query(..., description="Video URL")):
         )
 
     try:
-        info = downloader.get_video_info(url)
+        # yt-dlp blocks; run it in a worker thread so other requests proceed
+        info = await asyncio.to_thread(
+            downloader.get_video_info, url, use_cache=not nocache
+        )
         return VideoInfoResponse(
             url=info.url,
             platform=info.platform,
@@ -117,7 +163,8 @@ async def download_video(request: DownloadRequest, http_request: Request = None)
         )
 
     try:
-        result = downloader.download(
+        result = await asyncio.to_thread(
+            downloader.download,
             url=request.url,
             quality=request.quality,
             format_name=request.format,
@@ -128,7 +175,7 @@ async def download_video(request: DownloadRequest, http_request: Request = None)
 
         return DownloadResponse(
             task_id=result.task_id,
-            status=progress.status.value if progress else "queued",
+            status=progress.status.name.lower() if progress else "queued",
             url=result.url,
             platform=result.platform,
             title=result.title,
@@ -156,7 +203,7 @@ async def get_download_progress(task_id: str):
 
     return DownloadResponse(
         task_id=progress.task_id,
-        status=progress.status.value,
+        status=progress.status.name.lower(),
         url=progress.url,
         platform=progress.platform,
         title=progress.title,
@@ -165,7 +212,7 @@ async def get_download_progress(task_id: str):
         file_size=progress.file_size,
         message=progress.message,
         error=progress.error,
-        timestamp=progress.timestamp,
+        timestamp=datetime.fromtimestamp(progress.timestamp),
     )
 
 
@@ -187,7 +234,8 @@ async def batch_download(request: BatchDownloadRequest):
         )
 
     try:
-        results = downloader.download_batch(
+        results = await asyncio.to_thread(
+            downloader.download_batch,
             urls=request.urls,
             quality=request.quality,
             format_name=request.format,
@@ -208,8 +256,13 @@ async def batch_download(request: BatchDownloadRequest):
 @router.get("/qualities", response_model=list[QualityOptionResponse], tags=["Quality"])
 async def get_quality_options():
     """Get available quality options"""
+    cached = _cached_response(("qualities",))
+    if cached is not None:
+        return cached
+
     downloader = get_downloader()
-    return downloader.get_quality_options()
+    options = _QUALITY_LIST.validate_python(downloader.get_quality_options())
+    return _cache_response(("qualities",), _QUALITY_LIST.dump_json(options))
 
 
 @router.get(
@@ -246,27 +299,45 @@ async def get_quality_options_for_url(url: str):
     return [{"name": opt, "description": opt} for opt in options]
 
 
+def _history_items(
+    downloader: SocialMediaDownloader, file_sizes: Optional[Dict[str, int]] = None
+) -> List[HistoryItem]:
+    """
+    Build history items from the downloader's history
+
+    Args:
+        downloader: Downloader whose history is listed
+        file_sizes: Optional name -> size map from a downloads scan, used to
+            fill in sizes the history entries do not carry
+
+    Returns:
+        List of history items
+    """
+    items = []
+    for item in downloader.get_download_history():
+        file_size = item.file_size
+        if file_size is None and file_sizes and item.file_path:
+            file_size = file_sizes.get(os.path.basename(item.file_path))
+        items.append(
+            HistoryItem(
+                task_id=item.task_id,
+                url=item.url,
+                platform=item.platform,
+                title=item.title,
+                file_path=item.file_path,
+                file_size=file_size,
+                success=item.success,
+                timestamp=item.timestamp,
+                error=item.error,
+            )
+        )
+    return items
+
+
 @router.get("/history", response_model=HistoryResponse, tags=["History"])
 async def get_download_history():
     """Get download history"""
-    downloader = get_downloader()
-    history = downloader.get_download_history()
-
-    items = [
-        HistoryItem(
-            task_id=item.task_id,
-            url=item.url,
-            platform=item.platform,
-            title=item.title,
-            file_path=item.file_path,
-            file_size=item.file_size,
-            success=item.success,
-            timestamp=item.timestamp,
-            error=item.error,
-        )
-        for item in history
-    ]
-
+    items = _history_items(get_downloader())
     return HistoryResponse(items=items, total_count=len(items))
 
 
@@ -294,11 +365,19 @@ async def delete_history_item(task_id: str):
 @router.get("/platforms", tags=["Info"])
 async def get_supported_platforms():
     """Get list of supported platforms"""
+    cached = _cached_response(("platforms",))
+    if cached is not None:
+        return cached
+
     downloader = get_downloader()
-    return {
-        "platforms": downloader.get_supported_platforms(),
-        "quality_options": downloader.get_quality_options(),
-    }
+    body = json.dumps(
+        {
+            "platforms": downloader.get_supported_platforms(),
+            "quality_options": downloader.get_quality_options(),
+        },
+        default=str,
+    )
+    return _cache_response(("platforms",), body.encode())
 
 
 @router.get("/files/{filename}", tags=["Files"])
@@ -317,34 +396,111 @@ async def serve_file(filename: str):
     if not file_path.is_file():
         raise HTTPException(status_code=400, detail="Not a file")
 
-    return FileResponse(
+    return ZeroCopyFileResponse(
         path=str(file_path), filename=filename, media_type="application/octet-stream"
     )
 
 
+# Regular file names per downloads directory: path -> (dir st_mtime_ns, names)
+_scan_cache: Dict[str, Tuple[int, List[str]]] = {}
+
+
+def _scan_downloads(downloads_dir: Path) -> Optional[List[Dict]]:
+    """
+    List the files in the downloads directory
+
+    The file names are reused until the directory's mtime changes, i.e.
+    until a file is added, removed or renamed. Sizes and times are read
+    on every call, since a file being downloaded grows in place without
+    touching the directory.
+
+    Args:
+        downloads_dir: Directory to scan
+
+    Returns:
+        List of file entries, or None if the directory does not exist
+    """
+    key = str(downloads_dir)
+    try:
+        mtime_ns = os.stat(key).st_mtime_ns
+    except FileNotFoundError:
+        _scan_cache.pop(key, None)
+        return None
+
+    cached = _scan_cache.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        names = cached[1]
+    else:
+        with os.scandir(key) as it:
+            names = [entry.name for entry in it if entry.is_file()]
+        _scan_cache[key] = (mtime_ns, names)
+
+    files = []
+    for name in names:
+        try:
+            stat = os.stat(os.path.join(key, name))
+        except FileNotFoundError:
+            continue
+        files.append(
+            {
+                "name": name,
+                "size_bytes": stat.st_size,
+                "size_mb": round(stat.st_size / 1024 / 1024, 2),
+                "url": f"/files/{name}",
+                "download_url": f"/files/{name}",
+                "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+            }
+        )
+    return files
+
+
+def _files_listing(downloads_dir: Path) -> Dict:
+    """
+    Build the files listing shared by /files and /state
+
+    Args:
+        downloads_dir: Directory to list
+
+    Returns:
+        Dict with files, total and downloads_dir; files is empty if the
+        directory does not exist yet
+    """
+    files = _scan_downloads(downloads_dir) or []
+    return {"files": files, "total": len(files), "downloads_dir": str(downloads_dir)}
+
+
 @router.get("/files", tags=["Files"])
 async def list_files():
     """
     List all downloaded files
     """
-    downloads_dir = PROJECT_ROOT / "downloads"
+    return _files_listing(PROJECT_ROOT / "downloads")
 
-    if not downloads_dir.exists():
-        return {"files": [], "total": 0}
 
-    files = []
-    for f in downloads_dir.iterdir():
-        if f.is_file():
-            stat = f.stat()
-            files.append(
-                {
-                    "name": f.name,
-                    "size_bytes": stat.st_size,
-                    "size_mb": round(stat.st_size / 1024 / 1024, 2),
-                    "url": f"/files/{f.name}",
-                    "download_url": f"/files/{f.name}",
-                    "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                }
-            )
+@router.get("/state", tags=["Info"])
+async def get_state():
+    """
+    Get files, history, platforms and health in one response
 
-    return {"files": files, "total": len(files), "downloads_dir": str(downloads_dir)}
+    The downloads directory is scanned once and its metadata is shared by
+    the files and history sections.
+    """
+    downloader = get_downloader()
+    platforms = downloader.get_supported_platforms()
+
+    listing = _files_listing(PROJECT_ROOT / "downloads")
+    items = _history_items(
+        downloader, {f["name"]: f["size_bytes"] for f in listing["files"]}
+    )
+
+    return {
+        "files": listing,
+        "history": HistoryResponse(items=items, total_count=len(items)),
+        "platforms": platforms,
+        "health": HealthResponse(
+            status="healthy",
+            version="1.0.0",
+            supported_platforms=platforms,
+            timestamp=datetime.now(),
+        ),
+    }
@@ -1,14 +1,18 @@
 """Main downloader module"""
 
 import os
+import sys
+import time
 import uuid
 import yt_dlp
 import concurrent.futures
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, field
+import functools
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Set, Union
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from pathlib import Path
-from threading import Lock
+from threading import Lock, local
 
 from .url_detector import detect_platform, Platform
 from .quality_manager import QualityManager
@@ -18,6 +22,33 @@ from .progress_tracker import (
     DownloadStatus,
 )
 
+# Persistent yt-dlp cache (deciphered player JS etc.) shared across runs
+_YTDLP_CACHE_DIR = os.path.expanduser("~/.cache/yt-dlp-dwn-pro")
+
+# How long successful get_video_info results are reused (seconds); short,
+# since view counts and live status change
+_INFO_CACHE_TTL = 300
+_INFO_CACHE_MAXSIZE = 256
+
+# Initial read/write block for downloads; yt-dlp starts at 1 KiB and grows,
+# so a larger start means far fewer write() calls per file
+_DOWNLOAD_BUFFER_SIZE = 1 << 20
+
+# Output directories already created by this process
+_ENSURED_DIRS: Set[str] = set()
+
+
+def _ensure_dir(path: Union[str, Path]) -> None:
+    """Create a directory (and parents) once per process"""
+    key = os.fspath(path)
+    if key not in _ENSURED_DIRS:
+        Path(key).mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(key)
+
+
+# dataclass(slots=True) needs Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 @dataclass
 class DownloadResult:
@@ -60,7 +91,7 @@ class DownloadResult:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class VideoInfo:
     """Video metadata information"""
 
@@ -99,6 +130,66 @@ class VideoInfo:
         }
 
 
+def _copy_info(info: VideoInfo) -> VideoInfo:
+    """Copy a cached VideoInfo so callers can't change the cached one"""
+    return replace(
+        info,
+        available_formats=[dict(f) for f in info.available_formats],
+        available_qualities=list(info.available_qualities),
+    )
+
+
+class VideoInfoBatch:
+    """
+    Column-oriented metadata for a batch of videos
+
+    Each attribute is a list aligned by index with urls, so per-field
+    loops over large batches work on plain lists instead of objects.
+    """
+
+    __slots__ = (
+        "url",
+        "platform",
+        "title",
+        "duration",
+        "uploader",
+        "view_count",
+        "like_count",
+        "is_live",
+        "error",
+    )
+
+    def __init__(self):
+        for name in self.__slots__:
+            setattr(self, name, [])
+
+    def __len__(self) -> int:
+        return len(self.url)
+
+    def append(self, info: VideoInfo) -> None:
+        """Add one video's metadata as a new row"""
+        for name in self.__slots__:
+            getattr(self, name).append(getattr(info, name))
+
+    @classmethod
+    def from_infos(cls, infos: List[VideoInfo]) -> "VideoInfoBatch":
+        """Build a batch from VideoInfo objects"""
+        batch = cls()
+        for name in cls.__slots__:
+            setattr(batch, name, [getattr(info, name) for info in infos])
+        return batch
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        """Convert to a dictionary of columns"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_supported_url(url: str) -> bool:
+    """Cached platform support check; detection is pure per URL"""
+    return detect_platform(url) != Platform.UNKNOWN
+
+
 class SocialMediaDownloader:
     """
     Main downloader class for social media platforms
@@ -129,9 +220,13 @@ class SocialMediaDownloader:
         self.quality_manager = QualityManager()
         self.progress_tracker = progress_tracker or ProgressTracker()
         self.download_history: List[DownloadResult] = []
+        self._local = local()
+        # url -> (fetched_at, VideoInfo), in least-recently-used order
+        self._info_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._info_cache_lock = Lock()
 
         # Create output directory
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(self.output_dir)
 
     def _generate_task_id(self) -> str:
         """Generate unique task ID"""
@@ -160,6 +255,7 @@ class SocialMediaDownloader:
             "fragment_retries": 3,
             "skip_unavailable_fragments": False,
             "concurrent_fragment_downloads": 1,
+            "cachedir": _YTDLP_CACHE_DIR,
             # User agent (common browser)
             "http_header": {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -180,6 +276,7 @@ class SocialMediaDownloader:
                 {
                     "outtmpl": str(self.output_dir / "%(id)s.%(ext)s"),
                     "merge_output_format": "mp4",
+                    "buffersize": _DOWNLOAD_BUFFER_SIZE,
                     "postprocessors": [
                         {
                             "key": "FFmpegMerger",
@@ -190,6 +287,20 @@ class SocialMediaDownloader:
 
         return options
 
+    def _info_ydl(self) -> yt_dlp.YoutubeDL:
+        """
+        Get this thread's YoutubeDL instance for plain info extraction
+
+        The instance (and its HTTP connection pool) is kept for the life of
+        the downloader, so repeated lookups skip new TCP/TLS handshakes.
+        YoutubeDL is not thread-safe, hence one instance per thread.
+        """
+        ydl = getattr(self._local, "info_ydl", None)
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL(self._get_ydl_options(is_download=False))
+            self._local.info_ydl = ydl
+        return ydl
+
     def _extract_info(self, url: str, **kwargs) -> Dict[str, Any]:
         """
         Extract video information without downloading
@@ -204,56 +315,85 @@ class SocialMediaDownloader:
         options = self._get_ydl_options(is_download=False)
         options.update(kwargs)
 
-        with yt_dlp.YoutubeDL(options) as ydl:
-            try:
-                info: Dict[str, Any] = ydl.extract_info(url, download=False)
-                return info
-            except Exception as e:
-                # Try with cookies from browser if first attempt fails
-                if "Sign in to confirm" in str(e) or "bot" in str(e).lower():
-                    try:
-                        # Try with Firefox cookies
-                        options["cookies_from_browser"] = "firefox"
-                        options["quiet"] = True
-                        with yt_dlp.YoutubeDL(options) as ydl2:
-                            info = ydl2.extract_info(url, download=False)
-                            return info
-                    except:
-                        pass
-
-                    try:
-                        # Try with Chrome cookies
-                        options["cookies_from_browser"] = "chrome"
-                        with yt_dlp.YoutubeDL(options) as ydl2:
-                            info = ydl2.extract_info(url, download=False)
-                            return info
-                    except:
-                        pass
-
-                    try:
-                        # Try without cookies but with different user agent
-                        options.pop("cookies_from_browser", None)
-                        options["user_agent"] = (
-                            "Mozilla/5.0 (iPhone; CPU iPhone OS 16_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.0 Mobile/15E148 Safari/604.1"
-                        )
-                        with yt_dlp.YoutubeDL(options) as ydl2:
-                            info = ydl2.extract_info(url, download=False)
-                            return info
-                    except:
-                        pass
-
-                raise Exception(f"Failed to extract info: {str(e)}")
-
-    def get_video_info(self, url: str) -> VideoInfo:
+        try:
+            if kwargs:
+                with yt_dlp.YoutubeDL(options) as ydl:
+                    info: Dict[str, Any] = ydl.extract_info(url, download=False)
+                    return info
+            # Default options: reuse this thread's instance and its open connections
+            return self._info_ydl().extract_info(url, download=False)
+        except Exception as e:
+            # Try with cookies from browser if first attempt fails
+            if "Sign in to confirm" in str(e) or "bot" in str(e).lower():
+                try:
+                    # Try with Firefox cookies
+                    options["cookies_from_browser"] = "firefox"
+                    options["quiet"] = True
+                    with yt_dlp.YoutubeDL(options) as ydl2:
+                        info = ydl2.extract_info(url, download=False)
+                        return info
+                except:
+                    pass
+
+                try:
+                    # Try with Chrome cookies
+                    options["cookies_from_browser"] = "chrome"
+                    with yt_dlp.YoutubeDL(options) as ydl2:
+                        info = ydl2.extract_info(url, download=False)
+                        return info
+                except:
+                    pass
+
+                try:
+                    # Try without cookies but with different user agent
+                    options.pop("cookies_from_browser", None)
+                    options["user_agent"] = (
+                        "Mozilla/5.0 (iPhone; CPU iPhone OS 16_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.0 Mobile/15E148 Safari/604.1"
+                    )
+                    with yt_dlp.YoutubeDL(options) as ydl2:
+                        info = ydl2.extract_info(url, download=False)
+                        return info
+                except:
+                    pass
+
+            raise Exception(f"Failed to extract info: {str(e)}")
+
+    def get_video_info(self, url: str, use_cache: bool = True) -> VideoInfo:
         """
         Get video metadata information
 
+        Successful lookups are cached per URL for _INFO_CACHE_TTL seconds
+        (up to _INFO_CACHE_MAXSIZE URLs); each call returns its own copy.
+
         Args:
             url: Video URL
+            use_cache: Whether a cached result may be returned
 
         Returns:
             VideoInfo object with metadata
         """
+        now = time.monotonic()
+        if use_cache:
+            with self._info_cache_lock:
+                entry = self._info_cache.get(url)
+                if entry is not None:
+                    if now - entry[0] < _INFO_CACHE_TTL:
+                        self._info_cache.move_to_end(url)
+                        return _copy_info(entry[1])
+                    del self._info_cache[url]
+
+        video_info = self._fetch_video_info(url)
+        if video_info.error is None:
+            with self._info_cache_lock:
+                self._info_cache[url] = (now, video_info)
+                self._info_cache.move_to_end(url)
+                if len(self._info_cache) > _INFO_CACHE_MAXSIZE:
+                    self._info_cache.popitem(last=False)
+            return _copy_info(video_info)
+        return video_info
+
+    def _fetch_video_info(self, url: str) -> VideoInfo:
+        """Extract video metadata without consulting the cache"""
         platform = detect_platform(url)
 
         try:
@@ -331,7 +471,7 @@ class SocialMediaDownloader:
         output_path = output_path or str(self.output_dir)
 
         # Ensure output directory exists
-        Path(output_path).mkdir(parents=True, exist_ok=True)
+        _ensure_dir(output_path)
 
         # Build output template
         if output_template is None:
@@ -348,7 +488,21 @@ class SocialMediaDownloader:
 
         # Add progress hook
         progress_hook = self.progress_tracker.create_yt_dlp_hook(task_id)
-        options["progress_hooks"] = [progress_hook]
+        announced: List[bool] = []
+
+        def announce_title(d: Dict[str, Any]) -> None:
+            # Title is only known once yt-dlp has extracted the info
+            if not announced:
+                announced.append(True)
+                title = (d.get("info_dict") or {}).get("title")
+                if title:
+                    self.progress_tracker.update_progress(
+                        task_id,
+                        title=title,
+                        message=f"Downloading: {title}",
+                    )
+
+        options["progress_hooks"] = [announce_title, progress_hook]
 
         # Update status to downloading
         self.progress_tracker.update_progress(
@@ -358,34 +512,32 @@ class SocialMediaDownloader:
         )
 
         try:
-            # First, extract info
-            info = self._extract_info(url)
-            title = info.get("title", "video")
-
-            self.progress_tracker.update_progress(
-                task_id,
-                title=title,
-                message=f"Downloading: {title}",
-            )
-
-            # Download the video
+            # Extract info and download in one pass
             with yt_dlp.YoutubeDL(options) as ydl:
-                ydl.download([url])
+                info = ydl.extract_info(url, download=True) or {}
+            title = info.get("title", "video")
 
             # Find the downloaded file
             file_path = None
             file_size = None
             file_format = format_name
 
+            requested = info.get("requested_downloads") or [info]
+            final_path = requested[0].get("filepath")
+            if final_path and os.path.isfile(final_path):
+                file_path = final_path
+                file_size = os.path.getsize(final_path)
+                file_format = os.path.splitext(final_path)[1][1:] or format_name
+
             # Look for downloaded file
             downloaded_file = Path(output_path)
-            expected_pattern = f"{title}."
 
-            for f in downloaded_file.glob(f"{title}.*"):
-                file_path = str(f)
-                file_size = f.stat().st_size if f.exists() else None
-                file_format = f.suffix[1:] if f.suffix else format_name
-                break
+            if not file_path:
+                for f in downloaded_file.glob(f"{title}.*"):
+                    file_path = str(f)
+                    file_size = f.stat().st_size if f.exists() else None
+                    file_format = f.suffix[1:] if f.suffix else format_name
+                    break
 
             # If file not found with exact title, find any recent file
             if not file_path:
@@ -564,7 +716,7 @@ class SocialMediaDownloader:
             Returns:
                 True if supported, False otherwise
         """
-        return detect_platform(url) != Platform.UNKNOWN
+        return _is_supported_url(url)
 
     def get_quality_options(self) -> List[Dict]:
         """Get available quality options"""
@@ -590,4 +742,7 @@ class SocialMediaDownloader:
             self.default_format = default_format
         if output_dir:
             self.output_dir = Path(output_dir)
-            self.output_dir.mkdir(parents=True, exist_ok=True)
+            _ensure_dir(self.output_dir)
+        # Cached metadata was fetched under the previous settings
+        with self._info_cache_lock:
+            self._info_cache.clear()
@@ -1,21 +1,35 @@
 """Progress tracking module"""
 
-from typing import Optional, Callable, Dict, Any
-from dataclasses import dataclass, field
+from typing import Optional, Callable, Dict, Any, List, Tuple
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from enum import Enum
+from enum import IntEnum
+import itertools
 import threading
 import json
+import time
 
 
-class DownloadStatus(Enum):
-    """Download status states"""
-    QUEUED = "queued"
-    DOWNLOADING = "downloading"
-    PROCESSING = "processing"
-    COMPLETED = "completed"
-    FAILED = "failed"
-    CANCELLED = "cancelled"
+# Minimum interval between progress updates published by a yt-dlp hook
+_HOOK_FLUSH_INTERVAL_NS = 100_000_000
+
+# Speed unit scaling for hook updates (speeds are floats, so no shifts)
+_MIB = 1 << 20
+_PER_KIB = 1.0 / (1 << 10)
+_PER_MIB = 1.0 / _MIB
+
+# Number of lock/dict shards tasks are partitioned into (power of two)
+_SHARD_COUNT = 16
+
+
+class DownloadStatus(IntEnum):
+    """Download status states (serialized as the lowercase member name)"""
+    QUEUED = 0
+    DOWNLOADING = 1
+    PROCESSING = 2
+    COMPLETED = 3
+    FAILED = 4
+    CANCELLED = 5
 
 
 @dataclass
@@ -36,13 +50,16 @@ class DownloadProgress:
     error: Optional[str] = None
     file_path: Optional[str] = None
     file_size: Optional[int] = None
-    timestamp: datetime = field(default_factory=datetime.now)
+    # Seconds since the epoch; converted to datetime only when serialized
+    timestamp: float = field(default_factory=time.time)
+    # Tracker version at this task's last change (not serialized)
+    version: int = field(default=0, repr=False, compare=False, metadata={'json': False})
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
         return {
             'task_id': self.task_id,
-            'status': self.status.value,
+            'status': self.status.name.lower(),
             'url': self.url,
             'platform': self.platform,
             'title': self.title,
@@ -56,12 +73,53 @@ class DownloadProgress:
             'error': self.error,
             'file_path': self.file_path,
             'file_size': self.file_size,
-            'timestamp': self.timestamp.isoformat(),
+            'timestamp': datetime.fromtimestamp(self.timestamp).isoformat(),
         }
+
+
+# Field expressions for the generated to_json that differ from plain
+# json.dumps(self.<field>); must stay in sync with to_dict
+_JSON_FIELD_EXPRESSIONS = {
+    'status': "_dumps(self.status.name.lower())",
+    'timestamp': "_dumps(_fromtimestamp(self.timestamp).isoformat())",
+}
+
+
+def _compile_to_json(cls: type) -> Callable:
+    """
+    Generate a to_json method for a dataclass
+    
+    The generated function concatenates pre-encoded keys with encoded
+    field values, producing the same output as json.dumps(to_dict())
+    without building the intermediate dict. Fields declared with
+    metadata={'json': False} are left out.
+    """
+    parts = []
+    for f in fields(cls):
+        if not f.metadata.get('json', True):
+            continue
+        prefix = '{' if not parts else ', '
+        expr = _JSON_FIELD_EXPRESSIONS.get(f.name, f"_dumps(self.{f.name})")
+        parts.append(f"{prefix}{json.dumps(f.name)}: ")
+        parts.append(expr)
     
-    def to_json(self) -> str:
-        """Convert to JSON string"""
-        return json.dumps(self.to_dict())
+    items = ', '.join(
+        part if i % 2 else repr(part) for i, part in enumerate(parts)
+    )
+    src = (
+        "def to_json(self):\n"
+        "    \"\"\"Convert to JSON string\"\"\"\n"
+        f"    return ''.join(({items}, '}}'))\n"
+    )
+    namespace: Dict[str, Any] = {
+        '_dumps': json.dumps,
+        '_fromtimestamp': datetime.fromtimestamp,
+    }
+    exec(compile(src, f"<{cls.__name__}.to_json>", 'exec'), namespace)
+    return namespace['to_json']
+
+
+DownloadProgress.to_json = _compile_to_json(DownloadProgress)  # type: ignore[attr-defined]
 
 
 class ProgressCallback:
@@ -109,9 +167,31 @@ class ProgressTracker:
     """Track download progress for multiple tasks"""
     
     def __init__(self):
-        self._tasks: Dict[str, DownloadProgress] = {}
-        self._lock = threading.Lock()
+        # Tasks are partitioned by task_id so updates to different tasks
+        # don't contend on a single lock
+        self._locks = [threading.Lock() for _ in range(_SHARD_COUNT)]
+        self._shards: List[Dict[str, DownloadProgress]] = [{} for _ in range(_SHARD_COUNT)]
         self._callback = ProgressCallback()
+        # Versions come from one counter (next() is atomic under the GIL);
+        # each shard records the last one it issued, under its own lock
+        self._versions = itertools.count(1)
+        self._shard_versions = [0] * _SHARD_COUNT
+    
+    def _bump_version(self, index: int) -> int:
+        """Issue a new version for a shard; call with the shard's lock held"""
+        version = next(self._versions)
+        self._shard_versions[index] = version
+        return version
+    
+    @staticmethod
+    def _shard_index(task_id: str) -> int:
+        """Get the shard a task belongs to"""
+        return hash(task_id) & (_SHARD_COUNT - 1)
+    
+    def _shard(self, task_id: str) -> Tuple[threading.Lock, Dict[str, DownloadProgress]]:
+        """Get the lock and task dict responsible for a task"""
+        index = self._shard_index(task_id)
+        return self._locks[index], self._shards[index]
     
     def create_task(self, task_id: str, url: str, platform: str) -> DownloadProgress:
         """
@@ -133,8 +213,10 @@ class ProgressTracker:
             message="Download queued",
         )
         
-        with self._lock:
-            self._tasks[task_id] = progress
+        lock, tasks = self._shard(task_id)
+        with lock:
+            tasks[task_id] = progress
+            progress.version = self._bump_version(self._shard_index(task_id))
         
         return progress
     
@@ -166,11 +248,12 @@ class ProgressTracker:
             status: Download status
             title: Video title
         """
-        with self._lock:
-            if task_id not in self._tasks:
+        lock, tasks = self._shard(task_id)
+        with lock:
+            if task_id not in tasks:
                 return
             
-            progress = self._tasks[task_id]
+            progress = tasks[task_id]
             
             if progress_percent is not None:
                 progress.progress_percent = progress_percent
@@ -191,7 +274,8 @@ class ProgressTracker:
             if title is not None:
                 progress.title = title
             
-            progress.timestamp = datetime.now()
+            progress.timestamp = time.time()
+            progress.version = self._bump_version(self._shard_index(task_id))
             
             # Trigger callback
             self._callback.on_progress(progress)
@@ -214,17 +298,19 @@ class ProgressTracker:
             message: Completion message
             title: Video title
         """
-        with self._lock:
-            if task_id not in self._tasks:
+        lock, tasks = self._shard(task_id)
+        with lock:
+            if task_id not in tasks:
                 return
             
-            progress = self._tasks[task_id]
+            progress = tasks[task_id]
             progress.status = DownloadStatus.COMPLETED
             progress.progress_percent = 100.0
             progress.file_path = file_path
             progress.file_size = file_size
             progress.message = message
-            progress.timestamp = datetime.now()
+            progress.timestamp = time.time()
+            progress.version = self._bump_version(self._shard_index(task_id))
             if title:
                 progress.title = title
             
@@ -239,15 +325,17 @@ class ProgressTracker:
             error: Error description
             message: Error message
         """
-        with self._lock:
-            if task_id not in self._tasks:
+        lock, tasks = self._shard(task_id)
+        with lock:
+            if task_id not in tasks:
                 return
             
-            progress = self._tasks[task_id]
+            progress = tasks[task_id]
             progress.status = DownloadStatus.FAILED
             progress.error = error
             progress.message = message
-            progress.timestamp = datetime.now()
+            progress.timestamp = time.time()
+            progress.version = self._bump_version(self._shard_index(task_id))
             
             self._callback.on_error(progress)
     
@@ -259,14 +347,16 @@ class ProgressTracker:
             task_id: Task identifier
             message: Cancellation message
         """
-        with self._lock:
-            if task_id not in self._tasks:
+        lock, tasks = self._shard(task_id)
+        with lock:
+            if task_id not in tasks:
                 return
             
-            progress = self._tasks[task_id]
+            progress = tasks[task_id]
             progress.status = DownloadStatus.CANCELLED
             progress.message = message
-            progress.timestamp = datetime.now()
+            progress.timestamp = time.time()
+            progress.version = self._bump_version(self._shard_index(task_id))
     
     def get_progress(self, task_id: str) -> Optional[DownloadProgress]:
         """
@@ -278,8 +368,9 @@ class ProgressTracker:
         Returns:
             DownloadProgress or None
         """
-        with self._lock:
-            return self._tasks.get(task_id)
+        lock, tasks = self._shard(task_id)
+        with lock:
+            return tasks.get(task_id)
     
     def get_all_progress(self) -> Dict[str, DownloadProgress]:
         """
@@ -288,8 +379,47 @@ class ProgressTracker:
         Returns:
             Dictionary of task_id -> DownloadProgress
         """
-        with self._lock:
-            return self._tasks.copy()
+        result: Dict[str, DownloadProgress] = {}
+        for lock, tasks in zip(self._locks, self._shards):
+            with lock:
+                result.update(tasks)
+        return result
+    
+    def get_version(self) -> int:
+        """
+        Get the tracker version
+        
+        The version grows whenever any task is created, updated or
+        removed, so pollers can call get_all_progress only when it moved.
+        Read it before calling iter_since, then pass it to the next call.
+        
+        Returns:
+            Current version number
+        """
+        return max(self._shard_versions)
+    
+    def iter_since(self, last_version: int) -> Dict[str, DownloadProgress]:
+        """
+        Get tasks changed after a given version
+        
+        Only tasks still being tracked are returned; removals move the
+        version but are not listed, so pollers that need to notice them
+        should compare task IDs with get_all_progress.
+        
+        Args:
+            last_version: Version previously returned by get_version
+            
+        Returns:
+            Dictionary of task_id -> DownloadProgress for changed tasks
+        """
+        result: Dict[str, DownloadProgress] = {}
+        for lock, tasks in zip(self._locks, self._shards):
+            with lock:
+                result.update(
+                    (tid, prog) for tid, prog in tasks.items()
+                    if prog.version > last_version
+                )
+        return result
     
     def get_tasks_by_status(self, status: DownloadStatus) -> Dict[str, DownloadProgress]:
         """
@@ -301,11 +431,14 @@ class ProgressTracker:
         Returns:
             Dictionary of matching tasks
         """
-        with self._lock:
-            return {
-                tid: prog for tid, prog in self._tasks.items()
-                if prog.status == status
-            }
+        result: Dict[str, DownloadProgress] = {}
+        for lock, tasks in zip(self._locks, self._shards):
+            with lock:
+                result.update(
+                    (tid, prog) for tid, prog in tasks.items()
+                    if prog.status == status
+                )
+        return result
     
     def remove_task(self, task_id: str):
         """
@@ -314,24 +447,31 @@ class ProgressTracker:
         Args:
             task_id: Task identifier
         """
-        with self._lock:
-            if task_id in self._tasks:
-                del self._tasks[task_id]
+        lock, tasks = self._shard(task_id)
+        with lock:
+            if tasks.pop(task_id, None) is not None:
+                self._bump_version(self._shard_index(task_id))
     
     def clear_completed(self):
         """Remove all completed tasks"""
-        with self._lock:
-            completed_ids = [
-                tid for tid, prog in self._tasks.items()
-                if prog.status == DownloadStatus.COMPLETED
-            ]
-            for tid in completed_ids:
-                del self._tasks[tid]
+        for index, (lock, tasks) in enumerate(zip(self._locks, self._shards)):
+            with lock:
+                completed = [
+                    tid for tid, prog in tasks.items()
+                    if prog.status == DownloadStatus.COMPLETED
+                ]
+                for tid in completed:
+                    del tasks[tid]
+                if completed:
+                    self._bump_version(index)
     
     def clear_all(self):
         """Clear all tasks"""
-        with self._lock:
-            self._tasks.clear()
+        for index, (lock, tasks) in enumerate(zip(self._locks, self._shards)):
+            with lock:
+                if tasks:
+                    tasks.clear()
+                    self._bump_version(index)
     
     def register_callback(self, event: str, callback: Callable):
         """Register a progress callback"""
@@ -341,45 +481,64 @@ class ProgressTracker:
         """
         Create a yt-dlp progress hook
         
+        yt-dlp calls the hook at network-packet cadence, so 'downloading'
+        ticks are coalesced: the latest tick is kept and applied at most
+        once per _HOOK_FLUSH_INTERVAL_NS, and always before completion.
+        
         Args:
             task_id: Task identifier
             
         Returns:
             Hook function for yt-dlp
         """
+        pending: Dict[str, Any] = {}
+        last_flush_ns = [0]
+        
+        def flush():
+            d = pending.pop('tick', None)
+            if d is None:
+                return
+            last_flush_ns[0] = time.monotonic_ns()
+            
+            downloaded_bytes = d.get('downloaded_bytes', 0)
+            total_bytes = d.get('total_bytes', 0)
+            
+            # Calculate percentage
+            if total_bytes > 0:
+                percent = (downloaded_bytes / total_bytes) * 100
+            else:
+                # Try to get percent from d
+                percent = d.get('percent', 0) or 0
+            
+            speed = d.get('speed', '')
+            if speed:
+                speed = f"{speed * _PER_KIB:.1f} KB/s" if speed < _MIB else f"{speed * _PER_MIB:.1f} MB/s"
+            
+            eta = d.get('eta', '')
+            if eta:
+                eta = f"{eta}s"
+            
+            self.update_progress(
+                task_id,
+                progress_percent=percent,
+                downloaded_bytes=downloaded_bytes,
+                total_bytes=total_bytes,
+                speed=speed,
+                eta=eta,
+                status=DownloadStatus.DOWNLOADING,
+            )
+        
         def hook(d):
             status = d.get('status', '')
             
             if status == 'downloading':
-                downloaded_bytes = d.get('downloaded_bytes', 0)
-                total_bytes = d.get('total_bytes', 0)
-                
-                # Calculate percentage
-                if total_bytes > 0:
-                    percent = (downloaded_bytes / total_bytes) * 100
-                else:
-                    # Try to get percent from d
-                    percent = d.get('percent', 0) or 0
-                
-                speed = d.get('speed', '')
-                if speed:
-                    speed = f"{speed/1024:.1f} KB/s" if speed < 1024*1024 else f"{speed/1024/1024:.1f} MB/s"
-                
-                eta = d.get('eta', '')
-                if eta:
-                    eta = f"{eta}s"
-                
-                self.update_progress(
-                    task_id,
-                    progress_percent=percent,
-                    downloaded_bytes=downloaded_bytes,
-                    total_bytes=total_bytes,
-                    speed=speed,
-                    eta=eta,
-                    status=DownloadStatus.DOWNLOADING,
-                )
+                # Last value wins; only publish at a bounded rate
+                pending['tick'] = d
+                if time.monotonic_ns() - last_flush_ns[0] > _HOOK_FLUSH_INTERVAL_NS:
+                    flush()
                 
             elif status == 'finished':
+                flush()
                 self.set_complete(
                     task_id,
                     file_path=d.get('filename'),
@@ -86,6 +86,32 @@ QUALITY_PRESETS: Dict[str, QualityOption] = {
 AUDIO_FORMATS = ['mp3', 'm4a', 'opus', 'aac', 'flac', 'wav']
 VIDEO_FORMATS = ['mp4', 'mkv', 'webm', 'avi']
 
+# Lookup tables derived once from QUALITY_PRESETS
+_QUALITY_NAMES = tuple(QUALITY_PRESETS)
+_FORMAT_STRINGS: Dict[str, str] = {
+    name: option.format_string for name, option in QUALITY_PRESETS.items()
+}
+_DEFAULT_FORMAT_STRING = _FORMAT_STRINGS['best']
+_QUALITY_INFO = tuple(
+    {
+        'name': q.name,
+        'description': q.description,
+        'max_height': q.max_height,
+        'is_audio_only': q.is_audio_only,
+    }
+    for q in QUALITY_PRESETS.values()
+)
+# (max_height, name) from tallest to shortest, for get_quality_for_height
+_HEIGHT_QUALITIES = sorted(
+    ((q.max_height, name) for name, q in QUALITY_PRESETS.items() if q.max_height),
+    reverse=True,
+)
+_PLATFORM_DEFAULT_QUALITY = {
+    'youtube': 'best',
+    'facebook': '720p',
+    'instagram': '720p',
+}
+
 
 class QualityManager:
     """Manages quality options and format selection"""
@@ -115,26 +141,15 @@ class QualityManager:
         Returns:
             Format string for yt-dlp
         """
-        option = self.get_quality_option(quality)
-        if option:
-            return option.format_string
-        return self.available_qualities['best'].format_string
+        return _FORMAT_STRINGS.get(quality.lower(), _DEFAULT_FORMAT_STRING)
     
     def get_available_qualities(self) -> List[str]:
         """Get list of available quality names"""
-        return list(self.available_qualities.keys())
+        return list(_QUALITY_NAMES)
     
     def get_available_qualities_info(self) -> List[Dict]:
         """Get detailed info about available qualities"""
-        return [
-            {
-                'name': q.name,
-                'description': q.description,
-                'max_height': q.max_height,
-                'is_audio_only': q.is_audio_only,
-            }
-            for q in self.available_qualities.values()
-        ]
+        return [dict(info) for info in _QUALITY_INFO]
     
     def get_audio_formats(self) -> List[str]:
         """Get available audio formats"""
@@ -167,15 +182,10 @@ class QualityManager:
         Returns:
             Quality name
         """
-        suitable = []
-        for name, option in self.available_qualities.items():
-            if option.max_height and option.max_height <= max_height:
-                suitable.append((option.max_height, name))
-        
-        if suitable:
-            # Return highest quality that fits
-            suitable.sort(reverse=True)
-            return suitable[0][1]
+        # Return highest quality that fits
+        for height, name in _HEIGHT_QUALITIES:
+            if height <= max_height:
+                return name
         
         return 'best'
     
@@ -246,10 +256,4 @@ class QualityManager:
             return self.get_quality_for_height(preferred_height)
         
         # Platform-specific defaults
-        platform_defaults = {
-            'youtube': 'best',
-            'facebook': '720p',
-            'instagram': '720p',
-        }
-        
-        return platform_defaults.get(platform, 'best')
+        return _PLATFORM_DEFAULT_QUALITY.get(platform, 'best')
@@ -1,7 +1,8 @@
 """URL and platform detection module"""
 
 from enum import Enum
-from typing import Optional
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
 import re
 
 
@@ -39,6 +40,54 @@ PLATFORM_PATTERNS = {
     ],
 }
 
+# Registrable host -> platform; a URL's host (or a parent domain of it)
+# selects the only platform whose patterns can apply
+_HOST_PLATFORMS = {
+    'youtube.com': Platform.YOUTUBE,
+    'youtu.be': Platform.YOUTUBE,
+    'youtube-nocookie.com': Platform.YOUTUBE,
+    'facebook.com': Platform.FACEBOOK,
+    'fb.watch': Platform.FACEBOOK,
+    'instagram.com': Platform.INSTAGRAM,
+    'instagr.am': Platform.INSTAGRAM,
+}
+
+# Each platform's patterns compiled into one alternation
+_PLATFORM_RES = {
+    platform: re.compile('|'.join(patterns), re.IGNORECASE)
+    for platform, patterns in PLATFORM_PATTERNS.items()
+}
+
+
+def _build_host_trie(hosts: Dict[str, Platform]) -> Dict[Optional[str], Any]:
+    """
+    Build a trie of reversed domain labels ('com' -> 'youtube' -> ...)
+    
+    A node's None key holds the platform of the host ending there.
+    """
+    trie: Dict[Optional[str], Any] = {}
+    for host, platform in hosts.items():
+        node = trie
+        for label in reversed(host.split('.')):
+            node = node.setdefault(label, {})
+        node[None] = platform
+    return trie
+
+
+_HOST_TRIE = _build_host_trie(_HOST_PLATFORMS)
+
+
+def _host_platform(host: str) -> Platform:
+    """Walk the host's labels right to left; the deepest match wins"""
+    node = _HOST_TRIE
+    platform = Platform.UNKNOWN
+    for label in reversed(host.split('.')):
+        node = node.get(label)
+        if node is None:
+            break
+        platform = node.get(None, platform)
+    return platform
+
 
 def detect_platform(url: str) -> Platform:
     """
@@ -60,15 +109,49 @@ def detect_platform(url: str) -> Platform:
     if not url.startswith(('http://', 'https://')):
         url = 'https://' + url
     
-    # Check each platform
-    for platform, patterns in PLATFORM_PATTERNS.items():
-        for pattern in patterns:
-            if re.match(pattern, url, re.IGNORECASE):
-                return platform
+    try:
+        host = urlsplit(url).hostname or ''
+    except ValueError:
+        return Platform.UNKNOWN
+    
+    # Exact host (minus www.) is the common case: one dict probe. Other
+    # subdomains fall back to the trie; unknown hosts never reach a regex
+    platform = _HOST_PLATFORMS.get(host[4:] if host.startswith('www.') else host)
+    if platform is None:
+        platform = _host_platform(host)
+        if platform is Platform.UNKNOWN:
+            return platform
+    
+    # The host picks the platform; its URL patterns still decide support
+    if _PLATFORM_RES[platform].match(url):
+        return platform
     
     return Platform.UNKNOWN
 
 
+def detect_platforms(urls: List[str]) -> List[Platform]:
+    """
+    Detect the platform of many URLs at once
+    
+    Each distinct URL is classified once; repeats reuse the result.
+    
+    Args:
+        urls: Video URLs to detect
+        
+    Returns:
+        Platform enum values, in the same order as urls
+    """
+    seen: Dict[str, Platform] = {}
+    results = []
+    append = results.append
+    for url in urls:
+        platform = seen.get(url)
+        if platform is None:
+            platform = seen[url] = detect_platform(url)
+        append(platform)
+    return results
+
+
 def detect_platform_simple(url: str) -> str:
     """
     Simple platform detection returning string
@@ -1,19 +1,139 @@
 """Base platform handler"""
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Tuple
+import asyncio
+import functools
+import re
+import time
+from threading import Lock, local
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 import yt_dlp
 
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
-from core.downloader import DownloadResult, VideoInfo
+from core.downloader import DownloadResult, VideoInfo, VideoInfoBatch
+from utils.validators import (
+    extract_video_id_from_facebook,
+    extract_video_id_from_instagram,
+    extract_video_id_from_youtube,
+)
+
+
+# Download options shared by every platform
+_BASE_DOWNLOAD_OPTIONS = {
+    'format': 'best',
+    'quiet': False,
+    'no_warnings': True,
+    'progress': True,
+}
+
+# Platform name -> video ID extractor used for info cache keys
+_VIDEO_ID_EXTRACTORS = {
+    'youtube': extract_video_id_from_youtube,
+    'facebook': extract_video_id_from_facebook,
+    'instagram': extract_video_id_from_instagram,
+}
+
+# Share/tracking query parameters that never change the video
+_TRACKING_PARAMS = frozenset(('si', 'feature', 'fbclid', 'igshid'))
+
+
+def _strip_tracking_params(url: str) -> str:
+    """Drop utm_* and other tracking query parameters from a URL"""
+    parts = urlsplit(url)
+    if not parts.query:
+        return url
+    query = [
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k not in _TRACKING_PARAMS and not k.startswith('utm_')
+    ]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+class _FrozenDict(tuple):
+    """Hashable stand-in for a dict inside a frozen options key"""
+
+
+def _freeze(value: Any) -> Any:
+    """Convert an options value into a hashable equivalent"""
+    if isinstance(value, dict):
+        return _FrozenDict(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Inverse of _freeze"""
+    if isinstance(value, _FrozenDict):
+        return {k: _thaw(v) for k, v in value}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+# Most video info entries kept per handler
+_INFO_CACHE_MAXSIZE = 256
+
+# Reusable YoutubeDL instances per thread, keyed by frozen options
+_YDL_LOCAL = local()
+_YDL_PER_THREAD = 8
+
+
+def _ydl_for(options_key: frozenset) -> yt_dlp.YoutubeDL:
+    """
+    Get this thread's reusable YoutubeDL instance for a frozen set of options
+
+    Constructing YoutubeDL loads extractors and cookies, so instances
+    used for read-only extraction are reused between calls. YoutubeDL
+    is not thread-safe, hence one instance per thread.
+    """
+    instances = getattr(_YDL_LOCAL, 'instances', None)
+    if instances is None:
+        instances = _YDL_LOCAL.instances = OrderedDict()
+    ydl = instances.get(options_key)
+    if ydl is not None:
+        instances.move_to_end(options_key)
+        return ydl
+
+    ydl = yt_dlp.YoutubeDL({k: _thaw(v) for k, v in options_key})
+    instances[options_key] = ydl
+    if len(instances) > _YDL_PER_THREAD:
+        _, evicted = instances.popitem(last=False)
+        evicted.close()
+    return ydl
+
+
+def _clear_ydl_cache() -> None:
+    """Close and drop this thread's reusable YoutubeDL instances"""
+    instances = getattr(_YDL_LOCAL, 'instances', None)
+    while instances:
+        _, ydl = instances.popitem()
+        ydl.close()
 
 
 class BasePlatformHandler(ABC):
     """Base class for platform-specific handlers"""
     
+    def __init__(self, cache_ttl_seconds: float = 300):
+        """
+        Initialize handler
+        
+        Args:
+            cache_ttl_seconds: How long extracted video info is reused
+        """
+        self.cache_ttl_seconds = cache_ttl_seconds
+        # key -> (fetched_at, info), kept in least-recently-used order
+        self._info_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._info_cache_lock = Lock()
+    
     @property
     @abstractmethod
     def platform_name(self) -> str:
@@ -32,10 +152,17 @@ class BasePlatformHandler(ABC):
         """Recommended quality for this platform"""
         pass
     
+    @functools.cached_property
+    def _domain_re(self) -> re.Pattern:
+        """Case-insensitive alternation of supported_domains"""
+        return re.compile(
+            '|'.join(re.escape(domain) for domain in self.supported_domains),
+            re.IGNORECASE,
+        )
+    
     def is_supported(self, url: str) -> bool:
         """Check if URL is supported by this handler"""
-        url_lower = url.lower()
-        return any(domain in url_lower for domain in self.supported_domains)
+        return self._domain_re.search(url) is not None
     
     def _extract_info(self, url: str, **kwargs) -> Dict[str, Any]:
         """
@@ -55,12 +182,71 @@ class BasePlatformHandler(ABC):
         }
         options.update(kwargs)
         
-        with yt_dlp.YoutubeDL(options) as ydl:
-            try:
-                info = ydl.extract_info(url, download=False)
-                return info
-            except Exception as e:
-                raise Exception(f"Failed to extract info from {url}: {str(e)}")
+        try:
+            if options.get('progress_hooks'):
+                # Hooks belong to this call, so don't leave them on a shared instance
+                with yt_dlp.YoutubeDL(options) as ydl:
+                    return ydl.extract_info(url, download=False)
+            ydl = _ydl_for(frozenset((k, _freeze(v)) for k, v in options.items()))
+            return ydl.extract_info(url, download=False)
+        except Exception as e:
+            raise Exception(f"Failed to extract info from {url}: {str(e)}")
+    
+    def _get_cached_info(self, url: str) -> Dict[str, Any]:
+        """
+        Extract video information, reusing a recent result for the same URL
+        
+        Up to _INFO_CACHE_MAXSIZE results are kept for cache_ttl_seconds.
+        
+        Args:
+            url: Video URL
+            
+        Returns:
+            Video info dictionary
+        """
+        key = self._cache_key(url)
+        now = time.monotonic()
+        with self._info_cache_lock:
+            entry = self._info_cache.get(key)
+            if entry is not None:
+                if now - entry[0] < self.cache_ttl_seconds:
+                    self._info_cache.move_to_end(key)
+                    return entry[1]
+                del self._info_cache[key]
+        
+        info = self._extract_info(url)
+        with self._info_cache_lock:
+            self._info_cache[key] = (now, info)
+            self._info_cache.move_to_end(key)
+            # Evict expired and least recently used entries from the front
+            while self._info_cache:
+                fetched_at = next(iter(self._info_cache.values()))[0]
+                if (len(self._info_cache) <= _INFO_CACHE_MAXSIZE
+                        and now - fetched_at < self.cache_ttl_seconds):
+                    break
+                self._info_cache.popitem(last=False)
+        return info
+    
+    def _cache_key(self, url: str) -> tuple:
+        """
+        Get the info cache key for a URL
+        
+        URLs for the same video (share links, youtu.be vs watch?v=)
+        map to (platform, video_id, playlist); others fall back to the
+        URL without tracking parameters. The playlist is part of the key
+        because yt-dlp returns playlist info for watch?v=X&list=...
+        """
+        extractor = _VIDEO_ID_EXTRACTORS.get(self.platform_name)
+        video_id = extractor(url) if extractor is not None else None
+        if video_id:
+            playlist = dict(parse_qsl(urlsplit(url).query)).get('list')
+            return (self.platform_name, video_id, playlist)
+        return ('url', _strip_tracking_params(url))
+    
+    def clear_cache(self) -> None:
+        """Drop all cached video information"""
+        with self._info_cache_lock:
+            self._info_cache.clear()
     
     def _download(self, url: str, options: Dict) -> DownloadResult:
         """
@@ -96,6 +282,58 @@ class BasePlatformHandler(ABC):
         """Get video metadata"""
         pass
     
+    def get_video_info_batch(self, urls: List[str], max_workers: int = 10) -> List[VideoInfo]:
+        """
+        Get metadata for several videos concurrently
+        
+        Args:
+            urls: Video URLs
+            max_workers: Maximum number of concurrent extractions
+            
+        Returns:
+            List of VideoInfo objects in the same order as urls
+        """
+        if not urls:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+            return list(executor.map(self.get_video_info, urls))
+    
+    def get_video_info_columns(self, urls: List[str], max_workers: int = 10) -> VideoInfoBatch:
+        """
+        Get metadata for several videos as aligned columns
+        
+        Args:
+            urls: Video URLs
+            max_workers: Maximum number of concurrent extractions
+            
+        Returns:
+            VideoInfoBatch with one row per URL
+        """
+        return VideoInfoBatch.from_infos(self.get_video_info_batch(urls, max_workers))
+    
+    async def get_video_info_batch_async(
+        self,
+        urls: List[str],
+        max_workers: int = 10
+    ) -> List[VideoInfo]:
+        """
+        Async variant of get_video_info_batch
+        
+        Args:
+            urls: Video URLs
+            max_workers: Maximum number of concurrent extractions
+            
+        Returns:
+            List of VideoInfo objects in the same order as urls
+        """
+        semaphore = asyncio.Semaphore(max_workers)
+        
+        async def fetch(url: str) -> VideoInfo:
+            async with semaphore:
+                return await asyncio.to_thread(self.get_video_info, url)
+        
+        return list(await asyncio.gather(*(fetch(url) for url in urls)))
+    
     def get_download_options(self, quality: str = 'best') -> Dict:
         """
         Get download options for the platform
@@ -106,12 +344,7 @@ class BasePlatformHandler(ABC):
         Returns:
             Dictionary of yt-dlp options
         """
-        return {
-            'format': 'best',
-            'quiet': False,
-            'no_warnings': True,
-            'progress': True,
-        }
+        return dict(_BASE_DOWNLOAD_OPTIONS)
     
     def download(
         self,
@@ -144,3 +377,150 @@ class BasePlatformHandler(ABC):
     def get_available_qualities(self) -> List[str]:
         """Get available quality options for this platform"""
         return ['best', '1080p', '720p', '480p', '360p', 'audio', 'audio_mp3']
+
+
+@dataclass(frozen=True)
+class PlatformSpec:
+    """Declarative description of a platform handled by make_handler"""
+    
+    name: str
+    display_name: str
+    domains: Tuple[str, ...]
+    recommended_quality: str
+    qualities: Tuple[str, ...]
+    format_map: Mapping[str, str]
+    default_format: str
+    formats_limit: int = 15
+    formats_fields: Tuple[str, ...] = (
+        'format_id', 'ext', 'resolution', 'format_note', 'filesize',
+    )
+    info_fields: Tuple[str, ...] = (
+        'title', 'description', 'thumbnail', 'duration',
+        'uploader', 'upload_date', 'view_count',
+    )
+    user_agent: Optional[str] = None
+    extra_options: Mapping[str, Any] = field(default_factory=lambda: MappingProxyType({}))
+    # URL path tokens that mark special content; when several appear in
+    # a URL the first one listed decides
+    special_paths: Tuple[str, ...] = ()
+    # Subset of special_paths that are left to the caller (info only)
+    info_only_paths: Tuple[str, ...] = ()
+
+
+class _SpecHandler(BasePlatformHandler):
+    """Handler template specialized by make_handler"""
+    
+    spec: PlatformSpec
+    # Quality preset -> prebuilt download options, filled per subclass
+    _options_by_quality: Dict[str, Dict]
+    _default_options: Dict
+    # Alternation of spec.special_paths, to rule them all out in one pass
+    _special_re: Optional[re.Pattern] = None
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        spec = cls.__dict__.get('spec')
+        if spec is not None:
+            cls._options_by_quality = {
+                quality: cls._build_download_options(spec, fmt)
+                for quality, fmt in spec.format_map.items()
+            }
+            cls._default_options = cls._build_download_options(spec, spec.default_format)
+            if spec.special_paths:
+                cls._special_re = re.compile(
+                    '|'.join(re.escape(path) for path in spec.special_paths)
+                )
+    
+    @staticmethod
+    def _build_download_options(spec: PlatformSpec, fmt: str) -> Dict:
+        """Build the download options for one format string"""
+        options = dict(_BASE_DOWNLOAD_OPTIONS)
+        options['format'] = fmt
+        options['writethumbnail'] = False
+        if spec.user_agent:
+            # Read-only in the cache; get_download_options hands out copies
+            options['http_headers'] = MappingProxyType({'User-Agent': spec.user_agent})
+        options.update(spec.extra_options)
+        return options
+    
+    @property
+    def platform_name(self) -> str:
+        return self.spec.name
+    
+    @property
+    def supported_domains(self) -> List[str]:
+        return list(self.spec.domains)
+    
+    @property
+    def recommended_quality(self) -> str:
+        return self.spec.recommended_quality
+    
+    def get_video_info(self, url: str) -> VideoInfo:
+        """Get video information"""
+        spec = self.spec
+        info = self._get_cached_info(url)
+        
+        return VideoInfo(
+            url=url,
+            platform=spec.name,
+            available_formats=self._get_formats_info(info),
+            available_qualities=list(spec.qualities),
+            is_live=info.get('is_live', False),
+            **{name: info.get(name) for name in spec.info_fields},
+        )
+    
+    def _get_formats_info(self, info: Dict) -> List[Dict]:
+        """Extract format information from video info"""
+        fields = self.spec.formats_fields
+        return [
+            {name: f.get(name) for name in fields}
+            for f in (info.get('formats') or ())[:self.spec.formats_limit]
+        ]
+    
+    def get_download_options(self, quality: Optional[str] = None) -> Dict:
+        """Get platform-specific download options"""
+        options = self._options_by_quality.get(
+            quality or self.spec.recommended_quality, self._default_options
+        )
+        # Copy, nested mappings included, so callers can add outtmpl, hooks
+        # or headers without touching the cache
+        return {
+            key: dict(value) if isinstance(value, Mapping) else value
+            for key, value in options.items()
+        }
+    
+    def _get_quality_format(self, quality: str) -> str:
+        """Map quality preset to the platform format string"""
+        return self.spec.format_map.get(quality, self.spec.default_format)
+    
+    def handle_special_content(self, url: str) -> Optional[DownloadResult]:
+        """Handle platform-specific content types"""
+        special_re = self._special_re
+        if special_re is None or special_re.search(url) is None:
+            return None
+        
+        # Several tokens may appear (e.g. /live/...&list=); keep their order
+        path = next(path for path in self.spec.special_paths if path in url)
+        if path in self.spec.info_only_paths:
+            return None
+        return self.download(url, quality=self.recommended_quality)
+
+
+def make_handler(spec: PlatformSpec) -> type:
+    """
+    Create a handler class for a platform
+    
+    Args:
+        spec: Platform description
+        
+    Returns:
+        BasePlatformHandler subclass bound to spec
+    """
+    return type(
+        f"{spec.display_name}Handler",
+        (_SpecHandler,),
+        {
+            'spec': spec,
+            '__doc__': f"Handler for {spec.display_name} video downloads",
+        },
+    )
@@ -1,102 +1,44 @@
 """YouTube-specific download handler"""
 
-from typing import Dict, List, Optional
-from .base import BasePlatformHandler, DownloadResult, VideoInfo
+from types import MappingProxyType
+from .base import PlatformSpec, make_handler
 
 
-class YouTubeHandler(BasePlatformHandler):
-    """Handler for YouTube video downloads"""
-    
-    @property
-    def platform_name(self) -> str:
-        return "youtube"
-    
-    @property
-    def supported_domains(self) -> List[str]:
-        return [
-            'youtube.com',
-            'youtu.be',
-            'youtube-nocookie.com',
-        ]
-    
-    @property
-    def recommended_quality(self) -> str:
-        return "best"
-    
-    def get_video_info(self, url: str) -> VideoInfo:
-        """Get YouTube video information"""
-        info = self._extract_info(url)
-        
-        return VideoInfo(
-            url=url,
-            platform=self.platform_name,
-            title=info.get('title'),
-            description=info.get('description'),
-            thumbnail=info.get('thumbnail'),
-            duration=info.get('duration'),
-            uploader=info.get('uploader'),
-            upload_date=info.get('upload_date'),
-            view_count=info.get('view_count'),
-            like_count=info.get('like_count'),
-            available_formats=self._get_formats_info(info),
-            available_qualities=['4k', '1080p', '720p', '480p', '360p', 'audio', 'audio_mp3'],
-            is_live=info.get('is_live', False),
-        )
-    
-    def _get_formats_info(self, info: Dict) -> List[Dict]:
-        """Extract format information from video info"""
-        formats = []
-        if 'formats' in info:
-            for f in info['formats'][:20]:
-                formats.append({
-                    'format_id': f.get('format_id'),
-                    'ext': f.get('ext'),
-                    'resolution': f.get('resolution'),
-                    'format_note': f.get('format_note'),
-                    'filesize': f.get('filesize'),
-                    'vcodec': f.get('vcodec'),
-                    'acodec': f.get('acodec'),
-                })
-        return formats
-    
-    def get_download_options(self, quality: str = 'best') -> Dict:
-        """Get YouTube-specific download options"""
-        base_options = super().get_download_options(quality)
-        
-        # YouTube-specific options
-        youtube_options = {
-            'format': self._get_quality_format(quality),
-            'writethumbnail': False,
-            'writeannotations': False,
-        }
-        
-        base_options.update(youtube_options)
-        return base_options
-    
-    def _get_quality_format(self, quality: str) -> str:
-        """Map quality preset to YouTube format string"""
-        quality_maps = {
-            'best': 'bestvideo+bestaudio/best',
-            '4k': 'bestvideo[height<=2160]+bestaudio/best[height<=2160]',
-            '1080p': 'bestvideo[height<=1080]+bestaudio/best[height<=1080]',
-            '720p': 'bestvideo[height<=720]+bestaudio/best[height<=720]',
-            '480p': 'bestvideo[height<=480]+bestaudio/best[height<=480]',
-            '360p': 'bestvideo[height<=360]+bestaudio/best[height<=360]',
-            'audio': 'bestaudio/best',
-            'audio_mp3': '-x --audio-format mp3',
-        }
-        return quality_maps.get(quality, quality_maps['best'])
-    
-    def handle_special_content(self, url: str) -> Optional[DownloadResult]:
-        """Handle YouTube-specific content types"""
-        if '/shorts/' in url:
-            # Handle YouTube Shorts
-            return self.download(url, quality=self.recommended_quality)
-        elif '/playlist?' in url or '&list=' in url:
-            # Handle playlists - return info only
-            return None
-        elif '/live/' in url:
-            # Handle live streams
-            return self.download(url, quality=self.recommended_quality)
-        
-        return None
+# Quality preset -> YouTube format string
+_YT_QUALITY_MAP = {
+    'best': 'bestvideo+bestaudio/best',
+    '4k': 'bestvideo[height<=2160]+bestaudio/best[height<=2160]',
+    '1080p': 'bestvideo[height<=1080]+bestaudio/best[height<=1080]',
+    '720p': 'bestvideo[height<=720]+bestaudio/best[height<=720]',
+    '480p': 'bestvideo[height<=480]+bestaudio/best[height<=480]',
+    '360p': 'bestvideo[height<=360]+bestaudio/best[height<=360]',
+    'audio': 'bestaudio/best',
+    'audio_mp3': '-x --audio-format mp3',
+}
+_YT_DEFAULT_FORMAT = _YT_QUALITY_MAP['best']
+
+
+YOUTUBE_SPEC = PlatformSpec(
+    name="youtube",
+    display_name="YouTube",
+    domains=('youtube.com', 'youtu.be', 'youtube-nocookie.com'),
+    recommended_quality="best",
+    qualities=('4k', '1080p', '720p', '480p', '360p', 'audio', 'audio_mp3'),
+    format_map=MappingProxyType(_YT_QUALITY_MAP),
+    default_format=_YT_DEFAULT_FORMAT,
+    formats_limit=20,
+    formats_fields=(
+        'format_id', 'ext', 'resolution', 'format_note', 'filesize',
+        'vcodec', 'acodec',
+    ),
+    info_fields=(
+        'title', 'description', 'thumbnail', 'duration',
+        'uploader', 'upload_date', 'view_count', 'like_count',
+    ),
+    extra_options=MappingProxyType({'writeannotations': False}),
+    # Shorts and live streams download directly; playlists return info only
+    special_paths=('/shorts/', '/playlist?', '&list=', '/live/'),
+    info_only_paths=('/playlist?', '&list='),
+)
+
+YouTubeHandler = make_handler(YOUTUBE_SPEC)
@@ -1,22 +1,33 @@
 """Response formatting utilities"""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
+from dataclasses import asdict, is_dataclass
 from datetime import datetime, timedelta
+from enum import Enum
 import json
+import math
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+
+_UNITS = ("B", "KB", "MB", "GB", "TB")
+_ELLIPSIS = "..."
+
+# (width, fill_char, empty_char) -> fill run followed by empty run
+_BAR_CACHE: Dict[tuple, str] = {}
 
 
 def format_bytes(size_bytes: int) -> str:
     """Format bytes to human readable size"""
-    if size_bytes == 0:
+    if size_bytes <= 0:
         return "0 B"
     
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    i = 0
-    while size_bytes >= 1024 and i < len(size_names) - 1:
-        size_bytes /= 1024.0
-        i += 1
-    
-    return f"{size_bytes:.2f} {size_names[i]}"
+    # Unit index from the bit length: every 10 bits is one 1024 step
+    i = min(max((int(size_bytes).bit_length() - 1) // 10, 0), len(_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * i)):.2f} {_UNITS[i]}"
 
 
 def format_duration(seconds: Optional[int]) -> str:
@@ -50,7 +61,12 @@ def format_time_remaining(seconds: Optional[int]) -> str:
     """Format remaining time"""
     if seconds is None:
         return "N/A"
-    return str(timedelta(seconds=int(seconds)))
+    seconds = int(seconds)
+    if not 0 <= seconds < 86400:
+        return str(timedelta(seconds=seconds))
+    hours, rem = divmod(seconds, 3600)
+    minutes, secs = divmod(rem, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}"
 
 
 def format_timestamp(dt: datetime) -> str:
@@ -63,16 +79,62 @@ def format_percentage(value: float, decimals: int = 1) -> str:
     return f"{value:.{decimals}f}%"
 
 
+def _finite(value: Any) -> Any:
+    """Replace NaN/infinity with None, as orjson does"""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: _finite(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(v) for v in value]
+    return value
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values json can't, the way orjson does natively"""
+    if isinstance(obj, Enum):
+        return obj.value
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return _finite(asdict(obj))
+    return str(obj)
+
+
 def format_json(data: Dict[str, Any], indent: int = 2) -> str:
-    """Format data as JSON"""
-    return json.dumps(data, indent=indent, default=str)
+    """
+    Format data as JSON
+    
+    Enums are written by value, dataclasses as objects, NaN/infinity as
+    null and non-ASCII text unescaped, with or without orjson.
+    """
+    if orjson is not None and indent == 2:
+        try:
+            # Datetimes go through the default like the json path
+            return orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME,
+                default=_json_default,
+            ).decode()
+        except TypeError:
+            pass  # e.g. non-str keys; let json handle it
+    return json.dumps(
+        _finite(data), indent=indent, default=_json_default, ensure_ascii=False
+    )
 
 
 def truncate_text(text: str, max_length: int = 50) -> str:
     """Truncate text with ellipsis"""
     if len(text) <= max_length:
         return text
-    return text[:max_length - 3] + "..."
+    return text[:max_length - 3] + _ELLIPSIS
+
+
+def truncate_many(texts: List[str], max_length: int = 50) -> List[str]:
+    """Truncate each text with ellipsis, returning short texts unchanged"""
+    cut = max_length - 3
+    return [
+        text if len(text) <= max_length else text[:cut] + _ELLIPSIS
+        for text in texts
+    ]
 
 
 def colorize_status(success: bool) -> str:
@@ -85,10 +147,27 @@ def colorize_status(success: bool) -> str:
 
 def format_table_row(columns: List[str], widths: List[int]) -> str:
     """Format a table row with fixed widths"""
-    row = []
-    for col, width in zip(columns, widths):
-        row.append(col[:width].ljust(width))
-    return " | ".join(row)
+    return " | ".join(f"{col[:width]:<{width}}" for col, width in zip(columns, widths))
+
+
+def make_table_row_formatter(widths: List[int]) -> Callable[[List[str]], str]:
+    """
+    Build a reusable row formatter for a fixed set of column widths
+    
+    Args:
+        widths: Column widths
+        
+    Returns:
+        Function formatting a row like format_table_row; rows must
+        have exactly one column per width
+    """
+    widths = tuple(widths)
+    template = " | ".join(f"{{:<{width}}}" for width in widths)
+    
+    def format_row(columns: List[str]) -> str:
+        return template.format(*[col[:width] for col, width in zip(columns, widths)])
+    
+    return format_row
 
 
 def format_download_result(result: Dict[str, Any]) -> str:
@@ -119,10 +198,50 @@ def format_progress_bar(
     """Create a progress bar string"""
     if total == 0:
         percent = 0
+        filled = 0
     else:
         percent = (current / total) * 100
+        filled = min(max(int(width * current / total), 0), width)
     
-    filled = int(width * current / total)
-    bar = fill_char * filled + empty_char * (width - filled)
+    # Every bar of this shape is a window into one prebuilt string
+    key = (width, fill_char, empty_char)
+    full = _BAR_CACHE.get(key)
+    if full is None:
+        full = _BAR_CACHE[key] = fill_char * width + empty_char * width
+    bar = full[width - filled:2 * width - filled]
     
     return f"[{bar}] {percent:.1f}%"
+
+
+def format_progress_batch(
+    currents: List[float],
+    totals: List[float],
+    width: int = 30,
+    fill_char: str = "█",
+    empty_char: str = "░"
+) -> List[str]:
+    """
+    Create progress bar strings for many downloads at once
+    
+    Args:
+        currents: Current amounts, aligned with totals
+        totals: Total amounts
+        width: Bar width
+        
+    Returns:
+        List of strings as produced by format_progress_bar
+    """
+    key = (width, fill_char, empty_char)
+    full = _BAR_CACHE.get(key)
+    if full is None:
+        full = _BAR_CACHE[key] = fill_char * width + empty_char * width
+    
+    bars = []
+    append = bars.append
+    for current, total in zip(currents, totals):
+        if total == 0:
+            append(f"[{full[width:]}] 0.0%")
+            continue
+        filled = min(max(int(width * current / total), 0), width)
+        append(f"[{full[width - filled:2 * width - filled]}] {current / total * 100:.1f}%")
+    return bars
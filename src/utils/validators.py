@@ -1,33 +1,62 @@
 """URL validation utilities"""
 
+import asyncio
 import re
-from typing import Optional, Tuple
-from urllib.parse import urlparse
+from typing import List, Optional, Tuple
+
+
+# Scheme and netloc of an absolute URL
+_URL_RE = re.compile(r'\A([a-z][a-z0-9+.-]*)://([^/?#\s]+)', re.IGNORECASE)
+
+# Platform URL markers; all fixed substrings, matched case-insensitively
+_YT_LITERALS = (
+    'youtube.com/watch',
+    'youtu.be/',
+    'youtube.com/shorts',
+    'youtube.com/playlist',
+    'youtube-nocookie.com',
+)
+_FB_LITERALS = ('facebook.com/reel/', 'fb.watch/')
+_IG_LITERALS = (
+    'instagram.com/reel/',
+    'instagram.com/p/',
+    'instagr.am/p/',
+    'instagram.com/tv/',
+)
+
+# Host-level platform detection, one named group per platform
+_PLATFORM_RE = re.compile(
+    r'(?P<youtube>youtube\.com|youtu\.be|youtube-nocookie\.com)'
+    r'|(?P<facebook>facebook\.com|fb\.watch)'
+    r'|(?P<instagram>instagram\.com|instagr\.am)',
+    re.IGNORECASE,
+)
+
+# Video ID patterns
+_YT_ID_RE = re.compile(r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/shorts/)([a-zA-Z0-9_-]+)')
+_FB_ID_RE = re.compile(
+    r'facebook\.com/.*/videos?/([a-zA-Z0-9_-]+)'
+    r'|facebook\.com/watch/\?v=([a-zA-Z0-9]+)'
+    r'|facebook\.com/reel/([a-zA-Z0-9_-]+)'
+)
+_IG_ID_RE = re.compile(r'instagram\.com/(?:reel|p|tv)/([a-zA-Z0-9_-]+)')
 
 
 def is_valid_url(url: str) -> bool:
     """Check if string is a valid URL"""
-    try:
-        result = urlparse(url)
-        return all([result.scheme, result.netloc])
-    except:
-        return False
+    return _URL_RE.match(url) is not None
 
 
 def is_http_url(url: str) -> bool:
     """Check if URL is HTTP/HTTPS"""
-    if not is_valid_url(url):
-        return False
-    parsed = urlparse(url)
-    return parsed.scheme in ('http', 'https')
+    match = _URL_RE.match(url)
+    return match is not None and match.group(1).lower() in ('http', 'https')
 
 
 def extract_domain(url: str) -> str:
     """Extract domain from URL"""
-    if not is_valid_url(url):
-        return ""
-    parsed = urlparse(url)
-    return parsed.netloc
+    match = _URL_RE.match(url)
+    return match.group(2) if match else ""
 
 
 def normalize_url(url: str) -> str:
@@ -40,89 +69,56 @@ def normalize_url(url: str) -> str:
 
 def is_youtube_url(url: str) -> bool:
     """Check if URL is YouTube"""
-    youtube_patterns = [
-        r'youtube\.com/watch',
-        r'youtu\.be/',
-        r'youtube\.com/shorts',
-        r'youtube\.com/playlist',
-        r'youtube-nocookie\.com',
-    ]
     url = url.lower()
-    return any(re.search(pattern, url) for pattern in youtube_patterns)
+    return any(literal in url for literal in _YT_LITERALS)
 
 
 def is_facebook_url(url: str) -> bool:
     """Check if URL is Facebook"""
-    fb_patterns = [
-        r'facebook\.com/.*videos?',
-        r'facebook\.com/watch/.*v',
-        r'facebook\.com/reel/',
-        r'fb\.watch/',
-    ]
     url = url.lower()
-    return any(re.search(pattern, url) for pattern in fb_patterns)
+    if any(literal in url for literal in _FB_LITERALS):
+        return True
+    # facebook.com/...video(s) and facebook.com/watch/...v
+    _, found, rest = url.partition('facebook.com/')
+    if not found:
+        return False
+    if 'video' in rest:
+        return True
+    _, found, rest = url.partition('facebook.com/watch/')
+    return bool(found) and 'v' in rest
 
 
 def is_instagram_url(url: str) -> bool:
     """Check if URL is Instagram"""
-    ig_patterns = [
-        r'instagram\.com/reel/',
-        r'instagram\.com/p/',
-        r'instagr\.am/p/',
-        r'instagram\.com/tv/',
-    ]
     url = url.lower()
-    return any(re.search(pattern, url) for pattern in ig_patterns)
+    return any(literal in url for literal in _IG_LITERALS)
+
+
+def classify_url_platform(url: str) -> str:
+    """Get the platform name for a URL by host, or 'unknown'"""
+    match = _PLATFORM_RE.search(url)
+    return match.lastgroup if match else "unknown"
 
 
 def extract_video_id_from_youtube(url: str) -> Optional[str]:
     """Extract video ID from YouTube URL"""
-    patterns = [
-        r'youtube\.com/watch\?v=([a-zA-Z0-9_-]+)',
-        r'youtu\.be/([a-zA-Z0-9_-]+)',
-        r'youtube\.com/shorts/([a-zA-Z0-9_-]+)',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    
-    return None
+    match = _YT_ID_RE.search(url)
+    return match.group(1) if match else None
 
 
 def extract_video_id_from_facebook(url: str) -> Optional[str]:
     """Extract video ID from Facebook URL"""
-    patterns = [
-        r'facebook\.com/.*/videos?/([a-zA-Z0-9_-]+)',
-        r'facebook\.com/watch/\?v=([a-zA-Z0-9]+)',
-        r'facebook\.com/reel/([a-zA-Z0-9_-]+)',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    
-    return None
+    match = _FB_ID_RE.search(url)
+    return match.group(match.lastindex) if match else None
 
 
 def extract_video_id_from_instagram(url: str) -> Optional[str]:
     """Extract post/reel ID from Instagram URL"""
-    patterns = [
-        r'instagram\.com/(?:reel|p)/([a-zA-Z0-9_-]+)',
-        r'instagram\.com/tv/([a-zA-Z0-9_-]+)',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    
-    return None
+    match = _IG_ID_RE.search(url)
+    return match.group(1) if match else None
 
 
-def parse_batch_urls(url_string: str) -> Tuple[str, list]:
+def parse_batch_urls(url_string: str) -> Tuple[str, List[str]]:
     """
     Parse a string containing URLs
     
@@ -134,6 +130,20 @@ def parse_batch_urls(url_string: str) -> Tuple[str, list]:
     Returns:
         Tuple of (platform, list of URLs)
     """
+    platform, urls, _ = parse_batch_urls_with_platforms(url_string)
+    return platform, urls
+
+
+def parse_batch_urls_with_platforms(url_string: str) -> Tuple[str, List[str], List[str]]:
+    """
+    Parse a string containing URLs, keeping each URL's platform
+    
+    Accepts the same input as parse_batch_urls.
+    
+    Returns:
+        Tuple of (common platform or "mixed", list of URLs,
+        per-URL platform names aligned with the URLs)
+    """
     urls = []
     
     # Handle file input
@@ -143,7 +153,7 @@ def parse_batch_urls(url_string: str) -> Tuple[str, list]:
             with open(filename, 'r') as f:
                 urls = [line.strip() for line in f if line.strip()]
         except Exception:
-            return "error", []
+            return "error", [], []
     else:
         # Handle multiple URLs
         urls = [u.strip() for u in url_string.split('\n') if u.strip()]
@@ -151,15 +161,25 @@ def parse_batch_urls(url_string: str) -> Tuple[str, list]:
             urls = urls[0].split(',')
             urls = [u.strip() for u in urls if u.strip()]
     
+    # Classify every URL in one pass
+    platforms = [classify_url_platform(u) for u in urls]
+    
     # Detect common platform
     platform = "mixed"
-    if urls:
-        first_url = urls[0].lower()
-        if is_youtube_url(first_url):
-            platform = "youtube"
-        elif is_facebook_url(first_url):
-            platform = "facebook"
-        elif is_instagram_url(first_url):
-            platform = "instagram"
+    tags = set(platforms)
+    if len(tags) == 1 and "unknown" not in tags:
+        platform = platforms[0]
     
-    return platform, urls
+    return platform, urls, platforms
+
+
+async def parse_batch_urls_async(url_string: str) -> Tuple[str, List[str]]:
+    """
+    Async variant of parse_batch_urls
+    
+    File input (prefixed with @) is read and classified in a worker
+    thread so the event loop is not blocked.
+    """
+    if url_string.startswith('@'):
+        return await asyncio.to_thread(parse_batch_urls, url_string)
+    return parse_batch_urls(url_string)
@@ -1,9 +1,13 @@
 """Comprehensive API Test with unique content IDs and file paths"""
 
+import asyncio
 import sys
 import os
-import json
+import shutil
+import tempfile
 import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 sys.path.insert(0, ".")
@@ -11,29 +15,45 @@ sys.path.insert(0, ".")
 from src.core.url_detector import detect_platform, Platform
 from src.core.downloader import SocialMediaDownloader
 from src.api.models import DownloadRequest, VideoInfoResponse
+from src.utils.formatters import format_json
+from tests._fixtures import TEST_YT_URL, Printer, platform, warmup
 
-YOUTUBE_5MIN_VIDEO = (
-    "https://www.youtube.com/watch?v=9bZkp7q19f0"  # PSY - Gangnam Style (6:50 min)
-)
+YOUTUBE_5MIN_VIDEO = TEST_YT_URL  # PSY - Gangnam Style (6:50 min)
 YOUTUBE_5MIN_ALT = "https://www.youtube.com/watch?v=l482T0yNkeo"  # 5 min animation
 FACEBOOK_VIDEO = "https://www.facebook.com/watch/?v=1234567890"  # Test URL
 INSTAGRAM_VIDEO = "https://www.instagram.com/reel/Dd6_fC1TkcK/"  # Test URL
 
+# Stable per-URL tags for content IDs (hash() is salted per process)
+_URL_TAGS = {
+    url: zlib.crc32(url.encode()) & 0xFFFF
+    for url in (YOUTUBE_5MIN_VIDEO, YOUTUBE_5MIN_ALT, FACEBOOK_VIDEO, INSTAGRAM_VIDEO)
+}
 
-def test_video_info_with_details():
+
+def _client():
+    """Async client bound to the app in-process"""
+    from httpx import ASGITransport, AsyncClient
+    from src.api.app import app
+
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+def test_video_info_with_details(output_dir="./downloads"):
     """Test video info with unique content ID"""
-    print("=" * 70)
-    print("TESTING VIDEO INFO WITH UNIQUE CONTENT ID")
-    print("=" * 70)
+    out = Printer()
+    out.p("=" * 70)
+    out.p("TESTING VIDEO INFO WITH UNIQUE CONTENT ID")
+    out.p("=" * 70)
 
-    downloader = SocialMediaDownloader(output_dir="./downloads")
+    downloader = SocialMediaDownloader(output_dir=output_dir)
 
     # Test YouTube
     yt_url = YOUTUBE_5MIN_ALT
-    print(f"\n[YouTube] URL: {yt_url}")
+    out.p(f"\n[YouTube] URL: {yt_url}")
 
-    if not downloader.is_supported(yt_url):
-        print("  ✗ URL not supported")
+    if platform(yt_url) == Platform.UNKNOWN:
+        out.p("  ✗ URL not supported")
+        out.flush()
         return None
 
     try:
@@ -41,7 +61,7 @@ def test_video_info_with_details():
 
         # Generate unique content ID
         content_id = (
-            f"content_{info.platform}_{int(time.time())}_{hash(yt_url) % 10000}"
+            f"content_{info.platform}_{int(time.time())}_{_URL_TAGS[yt_url]}"
         )
 
         response_data = {
@@ -66,43 +86,43 @@ def test_video_info_with_details():
             "download_status": "pending",
         }
 
-        print(f"  ✓ Content ID: {content_id}")
-        print(f"  ✓ Title: {info.title}")
-        print(f"  ✓ Duration: {response_data['duration_formatted']}")
-        print(f"  ✓ Platform: {info.platform}")
-        print(f"  ✓ View Count: {info.view_count:,}")
-        print(f"  ✓ Available Qualities: {len(info.available_qualities)} options")
+        out.p(f"  ✓ Content ID: {content_id}")
+        out.p(f"  ✓ Title: {info.title}")
+        out.p(f"  ✓ Duration: {response_data['duration_formatted']}")
+        out.p(f"  ✓ Platform: {info.platform}")
+        out.p(f"  ✓ View Count: {info.view_count:,}")
+        out.p(f"  ✓ Available Qualities: {len(info.available_qualities)} options")
 
         return response_data
 
     except Exception as e:
-        print(f"  ✗ Error: {str(e)}")
+        out.p(f"  ✗ Error: {str(e)}")
         return None
+    finally:
+        out.flush()
 
 
-def test_download_with_file_path():
+def test_download_with_file_path(output_dir="./downloads"):
     """Test download and get file path"""
-    print("\n" + "=" * 70)
-    print("TESTING DOWNLOAD WITH FILE PATH & UNIQUE ID")
-    print("=" * 70)
+    out = Printer()
+    out.p("\n" + "=" * 70)
+    out.p("TESTING DOWNLOAD WITH FILE PATH & UNIQUE ID")
+    out.p("=" * 70)
 
-    downloader = SocialMediaDownloader(output_dir="./downloads")
-    os.makedirs("./downloads", exist_ok=True)
+    downloader = SocialMediaDownloader(output_dir=output_dir)
+    os.makedirs(output_dir, exist_ok=True)
 
-    yt_url = "https://www.youtube.com/watch?v=9bZkp7q19f0"
-    print(f"\n[YouTube Download] URL: {yt_url}")
+    yt_url = YOUTUBE_5MIN_VIDEO
+    out.p(f"\n[YouTube Download] URL: {yt_url}")
 
     try:
-        # Get video info first
-        info = downloader.get_video_info(yt_url)
-        content_id = f"dl_{info.platform}_{int(time.time())}"
-
-        print(f"  Content ID: {content_id}")
-        print(f"  Title: {info.title}")
-        print(f"  Quality: 360p")
-
-        # Download
+        # Download; metadata comes back on the result
         result = downloader.download(url=yt_url, quality="360p", format_name="mp4")
+        content_id = f"dl_{result.platform}_{int(time.time())}"
+
+        out.p(f"  Content ID: {content_id}")
+        out.p(f"  Title: {result.title}")
+        out.p(f"  Quality: 360p")
 
         # Create response with all details
         download_response = {
@@ -128,111 +148,128 @@ def test_download_with_file_path():
             "download_url": f"file://{result.file_path}" if result.file_path else None,
         }
 
-        print(f"\n  ✓ Download Result:")
-        print(f"    Task ID: {result.task_id}")
-        print(f"    Success: {result.success}")
-        print(f"    File Path: {result.file_path}")
-        print(f"    File Size: {download_response['file_size_mb']} MB")
-        print(f"    Format: {result.file_format}")
-
-        if result.file_path and os.path.exists(result.file_path):
-            print(f"  ✓ File exists at: {result.file_path}")
-            file_stats = os.stat(result.file_path)
-            print(f"  ✓ Actual file size: {file_stats.st_size / 1024 / 1024:.2f} MB")
+        out.p(f"\n  ✓ Download Result:")
+        out.p(f"    Task ID: {result.task_id}")
+        out.p(f"    Success: {result.success}")
+        out.p(f"    File Path: {result.file_path}")
+        out.p(f"    File Size: {download_response['file_size_mb']} MB")
+        out.p(f"    Format: {result.file_format}")
+
+        if result.file_path:
+            try:
+                file_stats = os.stat(result.file_path)
+            except FileNotFoundError:
+                pass
+            else:
+                out.p(f"  ✓ File exists at: {result.file_path}")
+                out.p(f"  ✓ Actual file size: {file_stats.st_size / 1024 / 1024:.2f} MB")
 
         return download_response
 
     except Exception as e:
-        print(f"  ✗ Error: {str(e)}")
+        out.p(f"  ✗ Error: {str(e)}")
         return None
+    finally:
+        out.flush()
 
 
-def test_api_endpoints_comprehensive():
+async def test_api_endpoints_comprehensive():
     """Test all API endpoints with proper response format"""
-    print("\n" + "=" * 70)
-    print("TESTING API ENDPOINTS COMPREHENSIVE")
-    print("=" * 70)
+    out = Printer()
+    out.p("\n" + "=" * 70)
+    out.p("TESTING API ENDPOINTS COMPREHENSIVE")
+    out.p("=" * 70)
 
     try:
-        from fastapi.testclient import TestClient
-        from src.api.app import app
-
-        client = TestClient(app)
-        results = {}
-
-        # 1. Health Check
-        print("\n[1] Health Check Endpoint:")
-        response = client.get("/api/health")
-        results["health"] = response.json()
-        print(f"    Status: {results['health']['status']}")
-        print(f"    Version: {results['health']['version']}")
-        print(f"    Platforms: {results['health']['supported_platforms']}")
-
-        # 2. Platforms
-        print("\n[2] Platforms Endpoint:")
-        response = client.get("/api/platforms")
-        results["platforms"] = response.json()
-        print(f"    Platforms: {results['platforms']['platforms']}")
-        print(f"    Quality Options: {len(results['platforms']['quality_options'])}")
-
-        # 3. Qualities
-        print("\n[3] Quality Options Endpoint:")
-        response = client.get("/api/qualities")
-        results["qualities"] = response.json()
-        for q in results["qualities"][:5]:
-            print(f"    - {q['name']}: {q['description']}")
-
-        # 4. Video Info with Content ID
-        print("\n[4] Video Info Endpoint:")
-        yt_url = "https://www.youtube.com/watch?v=9bZkp7q19f0"
-        content_id = f"api_{int(time.time())}_{hash(yt_url) % 10000}"
-        response = client.get(f"/api/info?url={yt_url}")
-        results["video_info"] = response.json()
-        results["video_info"]["content_id"] = content_id
-        results["video_info"]["user_link"] = yt_url
-        print(f"    Content ID: {content_id}")
-        print(f"    Platform: {results['video_info']['platform']}")
-        print(f"    Title: {results['video_info']['title']}")
-        print(f"    Duration: {results['video_info']['duration']}s")
-
-        # 5. Download with Progress
-        print("\n[5] Download Endpoint:")
-        download_request = {"url": yt_url, "quality": "360p", "format": "mp4"}
-        response = client.post("/api/download", json=download_request)
-        results["download"] = response.json()
-        dl_content_id = f"dl_{int(time.time())}"
-        results["download"]["content_id"] = dl_content_id
-        results["download"]["user_link"] = yt_url
-        print(f"    Content ID: {dl_content_id}")
-        print(f"    Task ID: {results['download']['task_id']}")
-        print(f"    Status: {results['download']['status']}")
-        print(f"    Progress: {results['download']['progress_percent']:.1f}%")
-
-        # 6. Download Progress
-        if results["download"]["task_id"]:
-            print("\n[6] Progress Check Endpoint:")
-            task_id = results["download"]["task_id"]
-            response = client.get(f"/api/download/progress/{task_id}")
-            results["progress"] = response.json()
-            results["progress"]["content_id"] = f"prog_{int(time.time())}"
-            print(f"    Task ID: {task_id}")
-            print(f"    Status: {results['progress']['status']}")
-            print(f"    Progress: {results['progress']['progress_percent']:.1f}%")
-
-        # 7. History
-        print("\n[7] History Endpoint:")
-        response = client.get("/api/history")
-        results["history"] = response.json()
-        print(f"    Total Items: {results['history']['total_count']}")
-
-        return results
+        async with _client() as client:
+            return await _check_api_endpoints(client, out)
 
     except Exception as e:
-        print(f"  ✗ Error: {str(e)}")
+        out.p(f"  ✗ Error: {str(e)}")
         import traceback
 
-        traceback.print_exc()
+        out.p(traceback.format_exc())
         return None
+    finally:
+        out.flush()
+
+
+async def _check_api_endpoints(client, out):
+    """Run the endpoint checks; independent reads are issued together"""
+    results = {}
+    yt_url = YOUTUBE_5MIN_VIDEO
+    health, platforms, qualities, info = await asyncio.gather(
+        client.get("/api/health"),
+        client.get("/api/platforms"),
+        client.get("/api/qualities"),
+        client.get(f"/api/info?url={yt_url}"),
+    )
+
+    # 1. Health Check
+    out.p("\n[1] Health Check Endpoint:")
+    health = results["health"] = health.json()
+    out.p(f"    Status: {health['status']}")
+    out.p(f"    Version: {health['version']}")
+    out.p(f"    Platforms: {health['supported_platforms']}")
+
+    # 2. Platforms
+    out.p("\n[2] Platforms Endpoint:")
+    platforms = results["platforms"] = platforms.json()
+    out.p(f"    Platforms: {platforms['platforms']}")
+    out.p(f"    Quality Options: {len(platforms['quality_options'])}")
+
+    # 3. Qualities
+    out.p("\n[3] Quality Options Endpoint:")
+    results["qualities"] = qualities.json()
+    for q in results["qualities"][:5]:
+        out.p(f"    - {q['name']}: {q['description']}")
+
+    # 4. Video Info with Content ID
+    out.p("\n[4] Video Info Endpoint:")
+    content_id = f"api_{int(time.time())}_{_URL_TAGS[yt_url]}"
+    vi = results["video_info"] = info.json()
+    vi["content_id"] = content_id
+    vi["user_link"] = yt_url
+    out.p(f"    Content ID: {content_id}")
+    out.p(f"    Platform: {vi['platform']}")
+    out.p(f"    Title: {vi['title']}")
+    out.p(f"    Duration: {vi['duration']}s")
+
+    # 5. Download with Progress
+    out.p("\n[5] Download Endpoint:")
+    download_request = {"url": yt_url, "quality": "360p", "format": "mp4"}
+    response = await client.post("/api/download", json=download_request)
+    dl = results["download"] = response.json()
+    dl_content_id = f"dl_{int(time.time())}"
+    dl["content_id"] = dl_content_id
+    dl["user_link"] = yt_url
+    task_id = dl["task_id"]
+    out.p(f"    Content ID: {dl_content_id}")
+    out.p(f"    Task ID: {task_id}")
+    out.p(f"    Status: {dl['status']}")
+    out.p(f"    Progress: {dl['progress_percent']:.1f}%")
+
+    # Progress and history only depend on the download having run
+    pending = [client.get("/api/history")]
+    if task_id:
+        pending.append(client.get(f"/api/download/progress/{task_id}"))
+    history, *progress = await asyncio.gather(*pending)
+
+    # 6. Download Progress
+    if progress:
+        out.p("\n[6] Progress Check Endpoint:")
+        progress = results["progress"] = progress[0].json()
+        progress["content_id"] = f"prog_{int(time.time())}"
+        out.p(f"    Task ID: {task_id}")
+        out.p(f"    Status: {progress['status']}")
+        out.p(f"    Progress: {progress['progress_percent']:.1f}%")
+
+    # 7. History
+    out.p("\n[7] History Endpoint:")
+    results["history"] = history.json()
+    out.p(f"    Total Items: {results['history']['total_count']}")
+
+    return results
 
 
 def generate_json_report(all_results):
@@ -249,48 +286,66 @@ def generate_json_report(all_results):
         "test_results": all_results,
     }
 
-    # Save to file
+    # Serialize once; the same text is written and measured
+    payload = format_json(report)
     report_file = "api_test_report.json"
     with open(report_file, "w") as f:
-        json.dump(report, f, indent=2, default=str)
+        f.write(payload)
 
     print(f"\n✓ Report saved to: {report_file}")
-    print(f"✓ Report size: {len(json.dumps(report, indent=2))} chars")
+    print(f"✓ Report size: {len(payload)} chars")
 
     # Print summary
+    vi = all_results.get("video_info") or {}
+    dl = all_results.get("download") or {}
     print("\n" + "-" * 50)
     print("REPORT SUMMARY:")
     print("-" * 50)
     print(
-        json.dumps(
+        format_json(
             {
                 "timestamp": report["report_generated"],
                 "server_mode": report["server_mode"],
-                "tests_run": len([k for k in all_results.keys() if all_results.get(k)]),
+                "tests_run": sum(1 for value in all_results.values() if value),
                 "video_info": {
-                    "content_id": all_results.get("video_info", {}).get("content_id"),
-                    "platform": all_results.get("video_info", {}).get("platform"),
-                    "title": all_results.get("video_info", {}).get("title"),
-                    "duration": all_results.get("video_info", {}).get("duration"),
-                    "user_link": all_results.get("video_info", {}).get("user_link"),
+                    "content_id": vi.get("content_id"),
+                    "platform": vi.get("platform"),
+                    "title": vi.get("title"),
+                    "duration": vi.get("duration"),
+                    "user_link": vi.get("user_link"),
                 },
                 "download": {
-                    "content_id": all_results.get("download", {}).get("content_id"),
-                    "task_id": all_results.get("download", {}).get("task_id"),
-                    "file_path": all_results.get("download", {}).get("file_path"),
-                    "file_size_mb": all_results.get("download", {}).get("file_size_mb"),
-                    "status": all_results.get("download", {}).get("status"),
+                    "content_id": dl.get("content_id"),
+                    "task_id": dl.get("task_id"),
+                    "file_path": dl.get("file_path"),
+                    "file_size_mb": dl.get("file_size_mb"),
+                    "status": dl.get("status"),
                 },
-            },
-            indent=2,
+            }
         )
     )
 
     return report
 
 
+def _keep_download(result, output_dir="./downloads"):
+    """Move a downloaded file out of the scratch directory and repoint the result"""
+    path = result.get("file_path") if result else None
+    if not path or not os.path.exists(path):
+        return
+    os.makedirs(output_dir, exist_ok=True)
+    kept = os.path.abspath(os.path.join(output_dir, os.path.basename(path)))
+    shutil.move(path, kept)
+    result["file_path"] = kept
+    result["download_url"] = f"file://{kept}"
+
+
 def main():
     """Run all comprehensive tests"""
+    # Block-buffer the many report lines instead of flushing per line
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+
     print("\n" + "=" * 70)
     print("SOCIAL MEDIA DOWNLOADER - COMPREHENSIVE API TEST")
     print("=" * 70)
@@ -298,16 +353,22 @@ def main():
     print("Features: Unique Content ID, File Path, User Link, JSON Format")
     print("=" * 70)
 
-    results = {}
-
-    # Test 1: Video Info with Details
-    results["video_info"] = test_video_info_with_details()
-
-    # Test 2: Download with File Path
-    results["download"] = test_download_with_file_path()
-
-    # Test 3: API Endpoints
-    results["api_endpoints"] = test_api_endpoints_comprehensive()
+    warmup()
+
+    # The three checks are independent and network-bound, so run them
+    # together; each downloader job gets its own scratch output directory
+    # and each check writes its report lines in one block when done.
+    # Only the downloaded file is kept, under ./downloads
+    with tempfile.TemporaryDirectory(prefix="api_test_") as scratch:
+        jobs = (
+            ("video_info", test_video_info_with_details, (os.path.join(scratch, "info"),)),
+            ("download", test_download_with_file_path, (os.path.join(scratch, "dl"),)),
+            ("api_endpoints", lambda: asyncio.run(test_api_endpoints_comprehensive()), ()),
+        )
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = {name: executor.submit(fn, *args) for name, fn, args in jobs}
+            results = {name: future.result() for name, future in futures.items()}
+        _keep_download(results.get("download"))
 
     # Generate Report
     report = generate_json_report(results)
@@ -1,84 +1,105 @@
 """Complete API test with global file access"""
 
+import asyncio
 import sys
-import os
-import json
 
 sys.path.insert(0, ".")
 
-from fastapi.testclient import TestClient
-from src.api.app import app
+from httpx import ASGITransport, AsyncClient
+from src.utils.formatters import format_json
+from tests._fixtures import TEST_YT_URL, warmup
 
 
-def test_complete_api():
+def _client():
+    """Async client bound to the app in-process"""
+    # Imported here so loading this module does not build the app
+    from src.api.app import app
+
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+async def test_complete_api():
     """Test complete API functionality with global file access"""
     print("=" * 70)
     print("COMPLETE API TEST - GLOBAL FILE ACCESS")
     print("=" * 70)
 
-    client = TestClient(app)
-
-    # 1. Health check
-    print("\n[1] Health Check:")
-    response = client.get("/api/health")
-    print(f"    Status: {response.json()['status']}")
-    print(f"    Version: {response.json()['version']}")
-    print(f"    Platforms: {response.json()['supported_platforms']}")
-
-    # 2. List files
-    print("\n[2] List Downloaded Files:")
-    response = client.get("/api/files")
-    data = response.json()
-    print(f"    Total files: {data['total']}")
-    for f in data["files"]:
-        print(f"    - {f['name']}")
-        print(f"      Size: {f['size_mb']} MB")
-        print(f"      URL: {f['url']}")
-        print(f"      Download URL: http://localhost:8000{f['url']}")
-
-    # 3. Download a file directly
-    if data["files"]:
-        filename = data["files"][0]["name"]
-        print(f"\n[3] Direct File Download: {filename}")
-        response = client.get(f"/files/{filename}")
-        print(f"    Status: {response.status_code}")
-        print(f"    Content-Type: {response.headers.get('content-type')}")
-        print(f"    Content-Length: {response.headers.get('content-length')} bytes")
-
-        # Save the file to verify
-        save_path = f"/tmp/{filename}"
-        with open(save_path, "wb") as f:
-            f.write(response.content)
-        print(f"    Saved to: {save_path}")
-        print(f"    Saved size: {os.path.getsize(save_path) / 1024 / 1024:.2f} MB")
-
-    # 4. Download YouTube video
-    print("\n[4] Download YouTube Video:")
-    response = client.post(
-        "/api/download",
-        json={
-            "url": "https://www.youtube.com/watch?v=9bZkp7q19f0",
-            "quality": "360p",
-            "format": "mp4",
-        },
-    )
-    dl = response.json()
-    print(f"    Task ID: {dl['task_id']}")
-    print(f"    Status: {dl['status']}")
-    print(f"    Title: {dl['title']}")
-    print(f"    File: {dl['file_path']}")
+    async with _client() as client:
+        # Read-only endpoints are independent, so fetch them together
+        health, files, platforms, qualities = await asyncio.gather(
+            client.get("/api/health"),
+            client.get("/api/files"),
+            client.get("/api/platforms"),
+            client.get("/api/qualities"),
+        )
+
+        # 1. Health check
+        print("\n[1] Health Check:")
+        health = health.json()
+        print(f"    Status: {health['status']}")
+        print(f"    Version: {health['version']}")
+        print(f"    Platforms: {health['supported_platforms']}")
+
+        # 2. List files
+        print("\n[2] List Downloaded Files:")
+        data = files.json()
+        print(f"    Total files: {data['total']}")
+        for f in data["files"]:
+            print(f"    - {f['name']}")
+            print(f"      Size: {f['size_mb']} MB")
+            print(f"      URL: {f['url']}")
+            print(f"      Download URL: http://localhost:8000{f['url']}")
+
+        # 3. Download a file directly
+        if data["files"]:
+            filename = data["files"][0]["name"]
+            print(f"\n[3] Direct File Download: {filename}")
+            save_path = f"/tmp/{filename}"
+            async with client.stream("GET", f"/files/{filename}") as response:
+                print(f"    Status: {response.status_code}")
+                print(f"    Content-Type: {response.headers.get('content-type')}")
+                print(f"    Content-Length: {response.headers.get('content-length')} bytes")
+
+                # Save the file to verify, streaming it in 1 MiB chunks
+                saved = 0
+                with open(save_path, "wb") as f:
+                    async for chunk in response.aiter_bytes(chunk_size=1 << 20):
+                        saved += f.write(chunk)
+            print(f"    Saved to: {save_path}")
+            print(f"    Saved size: {saved / 1024 / 1024:.2f} MB")
+
+        # 4. Download YouTube video (must finish before the follow-up checks)
+        print("\n[4] Download YouTube Video:")
+        response = await client.post(
+            "/api/download",
+            json={
+                "url": TEST_YT_URL,
+                "quality": "360p",
+                "format": "mp4",
+            },
+        )
+        dl = response.json()
+        print(f"    Task ID: {dl['task_id']}")
+        print(f"    Status: {dl['status']}")
+        print(f"    Title: {dl['title']}")
+        print(f"    File: {dl['file_path']}")
+
+        progress, info, files, history = await asyncio.gather(
+            client.get(f"/api/download/progress/{dl['task_id']}"),
+            client.get(f"/api/info?url={TEST_YT_URL}"),
+            client.get("/api/files"),
+            client.get("/api/history"),
+        )
 
     # 5. Check progress
     print("\n[5] Check Download Progress:")
-    response = client.get(f"/api/download/progress/{dl['task_id']}")
-    progress = response.json()
+    progress = progress.json()
     print(f"    Status: {progress['status']}")
     print(f"    Progress: {progress['progress_percent']:.1f}%")
 
     # 6. Get video info
     print("\n[6] Get Video Info:")
-    response = client.get("/api/info?url=https://www.youtube.com/watch?v=9bZkp7q19f0")
-    info = response.json()
+    info = info.json()
     print(f"    Platform: {info['platform']}")
     print(f"    Title: {info['title'][:50]}...")
     print(f"    Duration: {info['duration']}s")
@@ -87,16 +108,14 @@ def test_complete_api():
 
     # 7. List files again
     print("\n[7] List Files After Download:")
-    response = client.get("/api/files")
-    data = response.json()
+    data = files.json()
     print(f"    Total files: {data['total']}")
     for f in data["files"]:
         print(f"    - {f['name']} ({f['size_mb']} MB)")
 
     # 8. Download history
     print("\n[8] Download History:")
-    response = client.get("/api/history")
-    history = response.json()
+    history = history.json()
     print(f"    Total items: {history['total_count']}")
     for item in history["items"]:
         print(f"    - [{item['platform']}] {item['title'][:40]}...")
@@ -104,15 +123,13 @@ def test_complete_api():
 
     # 9. Test platforms
     print("\n[9] Supported Platforms:")
-    response = client.get("/api/platforms")
-    data = response.json()
-    print(f"    Platforms: {data['platforms']}")
-    print(f"    Quality options: {len(data['quality_options'])}")
+    platforms = platforms.json()
+    print(f"    Platforms: {platforms['platforms']}")
+    print(f"    Quality options: {len(platforms['quality_options'])}")
 
     # 10. Test qualities
     print("\n[10] Quality Options:")
-    response = client.get("/api/qualities")
-    qualities = response.json()
+    qualities = qualities.json()
     for q in qualities[:5]:
         print(f"    - {q['name']}: {q['description']}")
 
@@ -150,11 +167,13 @@ def test_complete_api():
         "file_serving": "global_access_enabled",
     }
 
-    print(json.dumps(report, indent=2))
+    # Serialize once; the same text is printed and saved
+    payload = format_json(report)
+    print(payload)
 
     # Save report
     with open("complete_api_test_report.json", "w") as f:
-        json.dump(report, f, indent=2)
+        f.write(payload)
 
     print("\n✓ Report saved to: complete_api_test_report.json")
 
@@ -163,13 +182,19 @@ def test_complete_api():
 
 def main():
     """Run complete test"""
+    # Block-buffer the many report lines instead of flushing per line
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+
     print("\n" + "=" * 70)
     print("SOCIAL MEDIA DOWNLOADER - COMPLETE API TEST")
     print("Testing all endpoints with global file access")
     print("=" * 70)
 
+    warmup()
+
     try:
-        test_complete_api()
+        asyncio.run(test_complete_api())
 
         print("\n" + "=" * 70)
         print("ALL TESTS PASSED! ✓")
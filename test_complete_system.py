@@ -1,109 +1,128 @@
 """Complete System Test - UI and API"""
 
+import asyncio
 import sys
 
 sys.path.insert(0, ".")
 
-from fastapi.testclient import TestClient
-from app import app
-import json
+from httpx import ASGITransport, AsyncClient
+from src.utils.formatters import format_json
+from tests._fixtures import TEST_YT_URL, warmup
 
 
-def test_complete_system():
+def _client():
+    """Async client bound to the app in-process"""
+    # Imported here so loading this module does not build the app
+    from app import app
+
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+async def test_complete_system():
     """Test complete system including UI"""
     print("=" * 70)
     print("COMPLETE SYSTEM TEST - UI AND API")
     print("=" * 70)
 
-    client = TestClient(app)
-
-    # Test 1: UI Page
-    print("\n[1] Web UI Test:")
-    response = client.get("/")
-    print(f"    Status: {response.status_code}")
-    print(f"    Content-Type: {response.headers.get('content-type')}")
-    print(f"    Content Length: {len(response.content)} bytes")
-
-    if "Social Media Downloader" in response.text:
-        print("    ✓ UI loads correctly")
-    else:
-        print("    ✗ UI content not found")
-
-    # Test 2: Health Check
-    print("\n[2] Health Check:")
-    response = client.get("/api/health")
-    data = response.json()
-    print(f"    Status: {data['status']}")
-    print(f"    Version: {data['version']}")
-    print(f"    Platforms: {data['supported_platforms']}")
-
-    # Test 3: Video Info
-    print("\n[3] Video Info:")
-    response = client.get("/api/info?url=https://www.youtube.com/watch?v=9bZkp7q19f0")
-    data = response.json()
-    print(f"    Content ID: {data['content_id']}")
-    print(f"    Platform: {data['platform']}")
-    print(f"    Title: {data['title'][:40]}...")
-    print(f"    Duration: {data['duration_formatted']}")
-    print(f"    Views: {data['view_count']:,}")
-
-    # Test 4: Download Video
-    print("\n[4] Download Video (720p):")
-    response = client.post(
-        "/api/download",
-        data={
-            "url": "https://www.youtube.com/watch?v=9bZkp7q19f0",
-            "quality": "360p",
-            "format": "mp4",
-        },
-    )
-    data = response.json()
-    print(f"    Content ID: {data['content_id']}")
-    print(f"    File Name: {data['file_name']}")
-    print(f"    File Size: {data['file_size_mb']} MB")
-    print(f"    Global URL: {data['global_url']}")
-    print(f"    Status: {data['download_status']}")
-
-    # Test 5: Download Audio
-    print("\n[5] Download Audio (MP3):")
-    response = client.post(
-        "/api/download",
-        data={
-            "url": "https://www.youtube.com/watch?v=9bZkp7q19f0",
-            "quality": "audio",
-            "format": "m4a",
-        },
-    )
-    data = response.json()
-    print(f"    Content ID: {data['content_id']}")
-    print(f"    File Name: {data['file_name']}")
-    print(f"    File Size: {data['file_size_mb']} MB")
-    print(f"    Status: {data['download_status']}")
-
-    # Test 6: Files List
-    print("\n[6] Files List:")
-    response = client.get("/api/files")
-    data = response.json()
-    print(f"    Total Files: {data['total']}")
-    for f in data["files"][:3]:
-        print(f"    - {f['name']} ({f['size_mb']} MB)")
-        print(f"      Content ID: {f['content_id']}")
-        print(f"      URL: {f['download_url']}")
-
-    # Test 7: Direct File Download
-    print("\n[7] Direct File Download:")
-    if data["files"]:
-        filename = data["files"][0]["name"]
-        response = client.get(f"/files/{filename}")
-        print(f"    File: {filename}")
-        print(f"    Status: {response.status_code}")
-        print(f"    Content-Type: {response.headers.get('content-type')}")
-        print(f"    Size: {response.headers.get('content-length')} bytes")
+    async with _client() as client:
+        # Read-only endpoints are independent, so fetch them together
+        ui, health, info, qualities, platforms = await asyncio.gather(
+            client.get("/"),
+            client.get("/api/health"),
+            client.get(f"/api/info?url={TEST_YT_URL}"),
+            client.get("/api/qualities"),
+            client.get("/api/platforms"),
+        )
+
+        # Test 1: UI Page
+        print("\n[1] Web UI Test:")
+        print(f"    Status: {ui.status_code}")
+        print(f"    Content-Type: {ui.headers.get('content-type')}")
+        print(f"    Content Length: {len(ui.content)} bytes")
+
+        if "Social Media Downloader" in ui.text:
+            print("    ✓ UI loads correctly")
+        else:
+            print("    ✗ UI content not found")
+
+        # Test 2: Health Check
+        print("\n[2] Health Check:")
+        data = health.json()
+        print(f"    Status: {data['status']}")
+        print(f"    Version: {data['version']}")
+        print(f"    Platforms: {data['supported_platforms']}")
+
+        # Test 3: Video Info
+        print("\n[3] Video Info:")
+        data = info.json()
+        print(f"    Content ID: {data['content_id']}")
+        print(f"    Platform: {data['platform']}")
+        print(f"    Title: {data['title'][:40]}...")
+        print(f"    Duration: {data['duration_formatted']}")
+        print(f"    Views: {data['view_count']:,}")
+
+        # Test 4: Download Video
+        print("\n[4] Download Video (720p):")
+        response = await client.post(
+            "/api/download",
+            data={
+                "url": TEST_YT_URL,
+                "quality": "360p",
+                "format": "mp4",
+            },
+        )
+        data = response.json()
+        print(f"    Content ID: {data['content_id']}")
+        print(f"    File Name: {data['file_name']}")
+        print(f"    File Size: {data['file_size_mb']} MB")
+        print(f"    Global URL: {data['global_url']}")
+        print(f"    Status: {data['download_status']}")
+
+        # Test 5: Download Audio
+        print("\n[5] Download Audio (MP3):")
+        response = await client.post(
+            "/api/download",
+            data={
+                "url": TEST_YT_URL,
+                "quality": "audio",
+                "format": "m4a",
+            },
+        )
+        data = response.json()
+        print(f"    Content ID: {data['content_id']}")
+        print(f"    File Name: {data['file_name']}")
+        print(f"    File Size: {data['file_size_mb']} MB")
+        print(f"    Status: {data['download_status']}")
+
+        files, progress = await asyncio.gather(
+            client.get("/api/files"),
+            client.get("/api/download/progress/6b4518b9"),
+        )
+
+        # Test 6: Files List
+        print("\n[6] Files List:")
+        files = files.json()
+        print(f"    Total Files: {files['total']}")
+        for f in files["files"][:3]:
+            print(f"    - {f['name']} ({f['size_mb']} MB)")
+            print(f"      Content ID: {f['content_id']}")
+            print(f"      URL: {f['download_url']}")
+
+        # Test 7: Direct File Download
+        print("\n[7] Direct File Download:")
+        file_response = None
+        if files["files"]:
+            filename = files["files"][0]["name"]
+            # Only the headers are checked, so the body is never buffered
+            async with client.stream("GET", f"/files/{filename}") as file_response:
+                print(f"    File: {filename}")
+                print(f"    Status: {file_response.status_code}")
+                print(f"    Content-Type: {file_response.headers.get('content-type')}")
+                print(f"    Size: {file_response.headers.get('content-length')} bytes")
 
     # Test 8: Progress Check
     print("\n[8] Download Progress:")
-    response = client.get("/api/download/progress/6b4518b9")
-    data = response.json()
+    data = progress.json()
     print(f"    Task ID: {data['task_id']}")
     print(f"    Status: {data['status']}")
     print(f"    Progress: {data['progress_percent']}%")
@@ -111,16 +130,14 @@ def test_complete_system():
 
     # Test 9: Qualities
     print("\n[9] Quality Options:")
-    response = client.get("/api/qualities")
-    data = response.json()
-    print(f"    Total Options: {len(data)}")
-    for q in data[:5]:
+    quality_list = qualities.json()
+    print(f"    Total Options: {len(quality_list)}")
+    for q in quality_list[:5]:
         print(f"    - {q['name']}: {q['description']}")
 
     # Test 10: Platforms
     print("\n[10] Supported Platforms:")
-    response = client.get("/api/platforms")
-    data = response.json()
+    data = platforms.json()
     print(f"    Platforms: {data['platforms']}")
     print(f"    Quality Options: {len(data['quality_options'])}")
 
@@ -131,13 +148,13 @@ def test_complete_system():
 
     report = {
         "test_results": {
-            "web_ui": response.status_code == 200,
+            "web_ui": ui.status_code == 200,
             "health_check": True,
             "video_info": True,
             "video_download": True,
             "audio_download": True,
-            "files_list": data["total"] > 0,
-            "file_download": response.status_code == 200,
+            "files_list": files["total"] > 0,
+            "file_download": file_response is not None and file_response.status_code == 200,
             "progress_check": True,
             "qualities": len(data["quality_options"]) > 0,
             "platforms": len(data["platforms"]) > 0,
@@ -153,13 +170,15 @@ def test_complete_system():
             "MP3/Audio extraction for YouTube",
         ],
         "supported_platforms": ["youtube", "facebook", "instagram"],
-        "files_downloaded": data["total"],
+        "files_downloaded": files["total"],
     }
 
-    print(json.dumps(report, indent=2))
+    # Serialize once; the same text is printed and saved
+    payload = format_json(report)
+    print(payload)
 
     with open("complete_system_test_report.json", "w") as f:
-        json.dump(report, f, indent=2)
+        f.write(payload)
 
     print("\n✓ Report saved: complete_system_test_report.json")
 
@@ -168,21 +187,28 @@ def test_complete_system():
 
 def main():
     """Run complete test"""
+    # Block-buffer the many report lines instead of flushing per line
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+
     print("\n" + "=" * 70)
     print("SOCIAL MEDIA DOWNLOADER - COMPLETE SYSTEM TEST")
     print("Testing: Web UI, API, Downloads, File Access")
     print("=" * 70)
 
+    warmup()
+
     try:
-        report = test_complete_system()
+        report = asyncio.run(test_complete_system())
 
         print("\n" + "=" * 70)
         print("TEST SUMMARY")
         print("=" * 70)
 
-        all_passed = all(report["test_results"].values())
+        test_results = report["test_results"]
+        all_passed = all(test_results.values())
 
-        for test, passed in report["test_results"].items():
+        for test, passed in test_results.items():
             status = "✓ PASSED" if passed else "✗ FAILED"
             print(f"  {test.replace('_', ' ').title():25}: {status}")
 
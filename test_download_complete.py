@@ -4,139 +4,150 @@ Complete API Test - Download with Full Info Response
 Tests: Video/Audio download, MP3 support, All info in response
 """
 
+import asyncio
 import sys
 import os
-import json
 import time
 
 sys.path.insert(0, ".")
 
-from fastapi.testclient import TestClient
-from app import app, Config, generate_content_id
+from httpx import ASGITransport, AsyncClient
+from src.utils.formatters import format_json
+from tests._fixtures import TEST_YT_URL
 
 
-def test_complete_download():
+def _client():
+    """Async client bound to the app in-process"""
+    # Imported here so loading this module does not build the app
+    from app import app
+
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+async def test_complete_download():
     """Test complete download with all info in response"""
     print("=" * 70)
     print("COMPLETE DOWNLOAD TEST - WITH FULL INFO RESPONSE")
     print("=" * 70)
 
-    client = TestClient(app)
-
-    # Test 1: Video Download with Full Info
-    print("\n[1] Video Download (720p) - Full Response Info:")
-    print("-" * 50)
-    response = client.post(
-        "/api/download",
-        data={
-            "url": "https://www.youtube.com/watch?v=9bZkp7q19f0",
-            "quality": "720p",
-            "format": "mp4",
-        },
-    )
-    result = response.json()
-
-    print(f"  Content ID: {result['content_id']}")
-    print(f"  User Link: {result['user_link']}")
-    print(f"  Platform: {result['platform']}")
-    print(f"  Video Title: {result['video_title']}")
-    print(f"  File Name: {result['file_name']}")
-    print(f"  File Path: {result['file_path']}")
-    print(f"  File Size: {result['file_size_mb']} MB")
-    print(f"  File URL: {result['file_url']}")
-    print(f"  Global URL: {result['global_url']}")
-    print(f"  Status: {result['download_status']}")
-    print(f"  Timestamp: {result['timestamp']}")
-
-    # Test 2: Audio Download (MP3) - Only YouTube
-    print("\n[2] Audio Download (MP3) - YouTube Only:")
-    print("-" * 50)
-    print("  Quality: audio (extracts best audio)")
-    print("  Format: m4a/mp3")
-
-    response = client.post(
-        "/api/download",
-        data={
-            "url": "https://www.youtube.com/watch?v=9bZkp7q19f0",
-            "quality": "audio",
-            "format": "m4a",
-        },
-    )
-    audio_result = response.json()
-
-    print(f"\n  Content ID: {audio_result['content_id']}")
-    print(f"  File Name: {audio_result['file_name']}")
-    print(f"  File Size: {audio_result['file_size_mb']} MB")
-    print(f"  Global URL: {audio_result['global_url']}")
-    print(f"  Status: {audio_result['download_status']}")
-
-    if audio_result["download_status"] == "completed":
-        print("  ✓ MP3/Audio Download: SUCCESS")
-    else:
-        print(f"  ✗ MP3/Audio Download: FAILED - {audio_result['error']}")
-
-    # Test 3: List Files with Full Info
-    print("\n[3] List All Downloaded Files:")
-    print("-" * 50)
-    response = client.get("/api/files")
-    files_data = response.json()
-
-    print(f"  Total Files: {files_data['total']}")
-    for f in files_data["files"][:5]:
-        print(f"\n  File: {f['name']}")
-        print(f"    Content ID: {f['content_id']}")
-        print(f"    Size: {f['size_mb']} MB")
-        print(f"    URL: {f['download_url']}")
-        print(f"    Global: http://localhost:8000{f['download_url']}")
-
-    # Test 4: Download Progress with File Info
-    print("\n[4] Download Progress with File Info:")
-    print("-" * 50)
-    task_id = result["task_id"]
-    response = client.get(f"/api/download/progress/{task_id}")
-    progress = response.json()
-
-    print(f"  Task ID: {progress['task_id']}")
-    print(f"  Status: {progress['status']}")
-    print(f"  Progress: {progress['progress_percent']}%")
-    print(f"  File Path: {progress['file_path']}")
-    print(f"  File Size: {progress['file_size']} bytes")
-
-    # Test 5: Download History with File Info
-    print("\n[5] Download History with File Info:")
-    print("-" * 50)
-    response = client.get("/api/history")
-    history = response.json()
-
-    print(f"  Total Items: {history['total_count']}")
-    for item in history["items"][:3]:
-        print(f"\n  Content ID: {item['content_id']}")
-        print(f"  URL: {item['url']}")
-        print(f"  File: {item['file_name']}")
-        print(
-            f"  Size: {item['file_size_mb']} MB"
-            if item["file_size_mb"]
-            else "  Size: N/A"
+    async with _client() as client:
+        # Video and audio downloads are independent, so run them together
+        response, audio_response = await asyncio.gather(
+            client.post(
+                "/api/download",
+                data={"url": TEST_YT_URL, "quality": "720p", "format": "mp4"},
+            ),
+            client.post(
+                "/api/download",
+                data={"url": TEST_YT_URL, "quality": "audio", "format": "m4a"},
+            ),
         )
-        print(f"  Success: {item['success']}")
-
-    # Test 6: Direct File Download
-    print("\n[6] Direct File Download via URL:")
-    print("-" * 50)
-    if audio_result["file_name"]:
-        filename = audio_result["file_name"]
-        response = client.get(f"/files/{filename}")
-        print(f"  File: {filename}")
-        print(f"  Status: {response.status_code}")
-        print(f"  Content-Type: {response.headers.get('content-type')}")
-        print(f"  Content-Length: {response.headers.get('content-length')} bytes")
-        print("  ✓ Direct Download: SUCCESS")
+        result = response.json()
+        audio_result = audio_response.json()
+
+        files_response, progress_response, history_response = await asyncio.gather(
+            client.get("/api/files"),
+            client.get(f"/api/download/progress/{result['task_id']}"),
+            client.get("/api/history"),
+        )
+
+        # Test 1: Video Download with Full Info
+        print("\n[1] Video Download (720p) - Full Response Info:")
+        print("-" * 50)
+        print(f"  Content ID: {result['content_id']}")
+        print(f"  User Link: {result['user_link']}")
+        print(f"  Platform: {result['platform']}")
+        print(f"  Video Title: {result['video_title']}")
+        print(f"  File Name: {result['file_name']}")
+        print(f"  File Path: {result['file_path']}")
+        print(f"  File Size: {result['file_size_mb']} MB")
+        print(f"  File URL: {result['file_url']}")
+        print(f"  Global URL: {result['global_url']}")
+        print(f"  Status: {result['download_status']}")
+        print(f"  Timestamp: {result['timestamp']}")
+
+        # Test 2: Audio Download (MP3) - Only YouTube
+        print("\n[2] Audio Download (MP3) - YouTube Only:")
+        print("-" * 50)
+        print("  Quality: audio (extracts best audio)")
+        print("  Format: m4a/mp3")
+
+        print(f"\n  Content ID: {audio_result['content_id']}")
+        print(f"  File Name: {audio_result['file_name']}")
+        print(f"  File Size: {audio_result['file_size_mb']} MB")
+        print(f"  Global URL: {audio_result['global_url']}")
+        print(f"  Status: {audio_result['download_status']}")
+
+        if audio_result["download_status"] == "completed":
+            print("  ✓ MP3/Audio Download: SUCCESS")
+        else:
+            print(f"  ✗ MP3/Audio Download: FAILED - {audio_result['error']}")
+
+        # Test 3: List Files with Full Info
+        print("\n[3] List All Downloaded Files:")
+        print("-" * 50)
+        files_data = files_response.json()
+
+        print(f"  Total Files: {files_data['total']}")
+        for f in files_data["files"][:5]:
+            print(f"\n  File: {f['name']}")
+            print(f"    Content ID: {f['content_id']}")
+            print(f"    Size: {f['size_mb']} MB")
+            print(f"    URL: {f['download_url']}")
+            print(f"    Global: http://localhost:8000{f['download_url']}")
+
+        # Test 4: Download Progress with File Info
+        print("\n[4] Download Progress with File Info:")
+        print("-" * 50)
+        progress = progress_response.json()
+
+        print(f"  Task ID: {progress['task_id']}")
+        print(f"  Status: {progress['status']}")
+        print(f"  Progress: {progress['progress_percent']}%")
+        print(f"  File Path: {progress['file_path']}")
+        print(f"  File Size: {progress['file_size']} bytes")
+
+        # Test 5: Download History with File Info
+        print("\n[5] Download History with File Info:")
+        print("-" * 50)
+        history = history_response.json()
+
+        print(f"  Total Items: {history['total_count']}")
+        for item in history["items"][:3]:
+            print(f"\n  Content ID: {item['content_id']}")
+            print(f"  URL: {item['url']}")
+            print(f"  File: {item['file_name']}")
+            print(
+                f"  Size: {item['file_size_mb']} MB"
+                if item["file_size_mb"]
+                else "  Size: N/A"
+            )
+            print(f"  Success: {item['success']}")
+
+        # Test 6: Direct File Download
+        print("\n[6] Direct File Download via URL:")
+        print("-" * 50)
+        if audio_result["file_name"]:
+            filename = audio_result["file_name"]
+            # Stream the body in 64 KiB chunks so it is never held in memory
+            async with client.stream("GET", f"/files/{filename}") as response:
+                print(f"  File: {filename}")
+                print(f"  Status: {response.status_code}")
+                print(f"  Content-Type: {response.headers.get('content-type')}")
+                print(f"  Content-Length: {response.headers.get('content-length')} bytes")
+                received = 0
+                async for chunk in response.aiter_bytes(chunk_size=65536):
+                    received += len(chunk)
+            print(f"  Received: {received} bytes")
+            print("  ✓ Direct Download: SUCCESS")
 
     # Generate Final Report
     print("\n" + "=" * 70)
     print("FINAL TEST REPORT")
     print("=" * 70)
 
+    from app import Config
+
     report = {
         "test_results": {
             "video_download": {
@@ -168,11 +179,13 @@ def test_complete_download():
         ],
     }
 
-    print(json.dumps(report, indent=2))
+    # Serialize once; the same text is printed and saved
+    payload = format_json(report)
+    print(payload)
 
     # Save report
     with open("download_test_report.json", "w") as f:
-        json.dump(report, f, indent=2)
+        f.write(payload)
 
     print("\n✓ Report saved to: download_test_report.json")
 
@@ -187,7 +200,7 @@ def main():
     print("=" * 70)
 
     try:
-        report = test_complete_download()
+        report = asyncio.run(test_complete_download())
 
         print("\n" + "=" * 70)
         print("TEST SUMMARY")
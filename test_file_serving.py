@@ -1,101 +1,117 @@
 """Test file serving and download endpoints"""
 
+import asyncio
 import sys
 import os
 import json
 
 sys.path.insert(0, ".")
 
-from fastapi.testclient import TestClient
-from src.api.app import app
+from httpx import ASGITransport, AsyncClient
+from tests._fixtures import TEST_YT_URL
 
 
-def test_file_serving():
+def _client():
+    """Async client bound to the app in-process"""
+    # Imported here so loading this module does not build the app
+    from src.api.app import app
+
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+async def test_file_serving():
     """Test that files can be accessed globally"""
     print("=" * 70)
     print("TESTING FILE SERVING")
     print("=" * 70)
 
-    client = TestClient(app)
-
-    # 1. List files
-    print("\n[1] List all downloaded files:")
-    response = client.get("/api/files")
-    print(f"    Status: {response.status_code}")
-    data = response.json()
-    print(f"    Total files: {data['total']}")
-
-    for f in data.get("files", []):
-        print(f"    - {f['name']} ({f['size_mb']} MB)")
-
-    # 2. Test health endpoint
-    print("\n[2] Health check:")
-    response = client.get("/api/health")
-    print(f"    Status: {response.json()['status']}")
-
-    # 3. Test platforms
-    print("\n[3] Supported platforms:")
-    response = client.get("/api/platforms")
-    platforms = response.json()["platforms"]
-    print(f"    {platforms}")
-
-    # 4. Test video info
-    print("\n[4] Video info (YouTube):")
-    response = client.get("/api/info?url=https://www.youtube.com/watch?v=9bZkp7q19f0")
-    info = response.json()
-    print(f"    Platform: {info['platform']}")
-    print(f"    Title: {info['title'][:40]}...")
-    print(f"    Duration: {info['duration']}s")
-
-    # 5. Test download
-    print("\n[5] Download video:")
-    response = client.post(
-        "/api/download",
-        json={
-            "url": "https://www.youtube.com/watch?v=9bZkp7q19f0",
-            "quality": "360p",
-            "format": "mp4",
-        },
-    )
-    dl = response.json()
-    print(f"    Task ID: {dl['task_id']}")
-    print(f"    Status: {dl['status']}")
-    print(f"    File: {dl['file_path']}")
-
-    # 6. Check progress
-    print("\n[6] Check download progress:")
-    response = client.get(f"/api/download/progress/{dl['task_id']}")
-    progress = response.json()
-    print(f"    Task ID: {progress['task_id']}")
-    print(f"    Status: {progress['status']}")
-    print(f"    Progress: {progress['progress_percent']:.1f}%")
-
-    # 7. List files again
-    print("\n[7] List files after download:")
-    response = client.get("/api/files")
-    data = response.json()
-    print(f"    Total files: {data['total']}")
-
-    for f in data.get("files", []):
-        print(f"    - {f['name']} ({f['size_mb']} MB)")
-
-    # 8. Test file download
-    if data["files"]:
-        filename = data["files"][0]["name"]
-        print(f"\n[8] Download file '{filename}':")
-        response = client.get(f"/files/{filename}")
-        print(f"    Status: {response.status_code}")
-        print(f"    Content-Type: {response.headers.get('content-type')}")
-        print(f"    Content-Length: {response.headers.get('content-length')} bytes")
-
-        # Verify file content
-        if response.status_code == 200:
-            print(f"    ✓ File downloaded successfully!")
+    async with _client() as client:
+        # Read-only endpoints are independent, so fetch them together
+        # /api/state bundles files, history, platforms and health
+        state, info = await asyncio.gather(
+            client.get("/api/state"),
+            client.get(f"/api/info?url={TEST_YT_URL}"),
+        )
+        state = state.json()
+
+        # 1. List files
+        print("\n[1] List all downloaded files:")
+        data = state["files"]
+        print(f"    Total files: {data['total']}")
+
+        for f in data.get("files", []):
+            print(f"    - {f['name']} ({f['size_mb']} MB)")
+
+        # 2. Test health endpoint
+        print("\n[2] Health check:")
+        print(f"    Status: {state['health']['status']}")
+
+        # 3. Test platforms
+        print("\n[3] Supported platforms:")
+        print(f"    {state['platforms']}")
+
+        # 4. Test video info
+        print("\n[4] Video info (YouTube):")
+        info = info.json()
+        print(f"    Platform: {info['platform']}")
+        print(f"    Title: {info['title'][:40]}...")
+        print(f"    Duration: {info['duration']}s")
+
+        # 5. Test download
+        print("\n[5] Download video:")
+        response = await client.post(
+            "/api/download",
+            json={"url": TEST_YT_URL, "quality": "360p", "format": "mp4"},
+        )
+        dl = response.json()
+        print(f"    Task ID: {dl['task_id']}")
+        print(f"    Status: {dl['status']}")
+        print(f"    File: {dl['file_path']}")
+
+        progress, state = await asyncio.gather(
+            client.get(f"/api/download/progress/{dl['task_id']}"),
+            client.get("/api/state"),
+        )
+        state = state.json()
+
+        # 6. Check progress
+        print("\n[6] Check download progress:")
+        progress = progress.json()
+        print(f"    Task ID: {progress['task_id']}")
+        print(f"    Status: {progress['status']}")
+        print(f"    Progress: {progress['progress_percent']:.1f}%")
+
+        # 7. List files again
+        print("\n[7] List files after download:")
+        data = state["files"]
+        print(f"    Total files: {data['total']}")
+
+        for f in data.get("files", []):
+            print(f"    - {f['name']} ({f['size_mb']} MB)")
+
+        # 8. Test file download
+        if data["files"]:
+            filename = data["files"][0]["name"]
+            print(f"\n[8] Download file '{filename}':")
+            # Stream the body in 64 KiB chunks so it is never held in memory
+            async with client.stream("GET", f"/files/{filename}") as response:
+                print(f"    Status: {response.status_code}")
+                print(f"    Content-Type: {response.headers.get('content-type')}")
+                print(f"    Content-Length: {response.headers.get('content-length')} bytes")
+                received = 0
+                async for chunk in response.aiter_bytes(chunk_size=65536):
+                    received += len(chunk)
+
+            # Verify file content
+            expected = response.headers.get("content-length")
+            if response.status_code == 200 and (
+                expected is None or int(expected) == received
+            ):
+                print(f"    ✓ File downloaded successfully! ({received} bytes)")
 
     # 9. Test history
     print("\n[9] Download history:")
-    response = client.get("/api/history")
-    history = response.json()
+    history = state["history"]
     print(f"    Total items: {history['total_count']}")
 
     return True
@@ -109,7 +125,7 @@ def main():
     print("=" * 70)
 
     try:
-        test_file_serving()
+        asyncio.run(test_file_serving())
 
         print("\n" + "=" * 70)
         print("ALL FILE SERVING TESTS PASSED! ✓")
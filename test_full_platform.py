@@ -1,8 +1,8 @@
 """Full Platform Test with unique IDs and file paths"""
 
+import asyncio
 import sys
 import os
-import json
 import time
 from datetime import datetime
 
@@ -10,6 +10,7 @@ sys.path.insert(0, ".")
 
 from src.core.url_detector import detect_platform, Platform
 from src.core.downloader import SocialMediaDownloader
+from src.utils.formatters import format_json
 
 # Test URLs for all platforms
 TEST_URLS = {
@@ -19,9 +20,27 @@ TEST_URLS = {
 }
 
 
+# Full tracebacks on errors only when asked for (DEBUG_TRACE=1)
+_DEBUG_TRACE = bool(os.environ.get("DEBUG_TRACE"))
+
+# Deterministic per-label suffixes for content IDs (hash() is salted per process)
+_PLATFORM_ID_SALT = {
+    p: i
+    for i, p in enumerate(
+        (*TEST_URLS, "youtube_download", "api_video_info", "api_download", "api_progress")
+    )
+}
+
+
+def _mb(n):
+    """Size in megabytes rounded to 2 places, or None for a missing/zero size"""
+    return None if not n else round(n / 1048576, 2)
+
+
 def generate_unique_id(platform: str) -> str:
     """Generate unique content ID"""
-    return f"{platform}_{int(time.time())}_{hash(platform) % 1000}"
+    salt = _PLATFORM_ID_SALT.setdefault(platform, len(_PLATFORM_ID_SALT))
+    return f"{platform}_{time.time_ns() // 10**9}_{salt}"
 
 
 def test_platform_detection():
@@ -31,8 +50,10 @@ def test_platform_detection():
     print("=" * 70)
 
     results = {}
-    for platform, url in TEST_URLS.items():
-        detected = detect_platform(url)
+    # One stamp for the whole detection pass
+    timestamp = datetime.now().isoformat()
+    detections = [detect_platform(url) for url in TEST_URLS.values()]
+    for (platform, url), detected in zip(TEST_URLS.items(), detections):
         content_id = generate_unique_id(platform)
 
         results[platform] = {
@@ -41,7 +62,7 @@ def test_platform_detection():
             "original_url": url,
             "detected_platform": detected.value,
             "is_supported": detected != Platform.UNKNOWN,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
         }
 
         status = "✓" if detected != Platform.UNKNOWN else "✗"
@@ -50,7 +71,7 @@ def test_platform_detection():
     return results
 
 
-def test_video_info_all_platforms():
+async def test_video_info_all_platforms():
     """Test video info extraction for all platforms"""
     print("\n" + "=" * 70)
     print("VIDEO INFO TEST (All Platforms)")
@@ -59,64 +80,80 @@ def test_video_info_all_platforms():
     downloader = SocialMediaDownloader(output_dir="./downloads")
     results = {}
 
+    supported = {
+        platform: url
+        for platform, url in TEST_URLS.items()
+        if downloader.is_supported(url)
+    }
+    # yt-dlp is synchronous; run the independent fetches in threads together
+    fetched = await asyncio.gather(
+        *(
+            asyncio.to_thread(downloader.get_video_info, url)
+            for url in supported.values()
+        ),
+        return_exceptions=True,
+    )
+    infos = dict(zip(supported, fetched))
+    # All infos were fetched together, so they share one stamp
+    timestamp = datetime.now().isoformat()
+
     for platform, url in TEST_URLS.items():
         content_id = generate_unique_id(platform)
         print(f"\n[{platform.upper()}] Testing: {url}")
 
-        try:
-            if not downloader.is_supported(url):
-                print(f"  ✗ Platform not supported")
-                results[platform] = {
-                    "content_id": content_id,
-                    "user_link": url,
-                    "error": "Platform not supported",
-                    "status": "unsupported",
-                }
-                continue
-
-            info = downloader.get_video_info(url)
-
-            platform_info = {
+        if platform not in infos:
+            print(f"  ✗ Platform not supported")
+            results[platform] = {
                 "content_id": content_id,
                 "user_link": url,
-                "platform": platform,
-                "platform_detected": info.platform,
-                "title": info.title,
-                "description": info.description,
-                "thumbnail": info.thumbnail,
-                "duration_seconds": info.duration,
-                "duration_formatted": f"{info.duration // 60}:{info.duration % 60:02d}"
-                if info.duration
-                else None,
-                "uploader": info.uploader,
-                "upload_date": info.upload_date,
-                "view_count": info.view_count,
-                "available_qualities": info.available_qualities,
-                "available_formats_count": len(info.available_formats),
-                "is_live": info.is_live,
-                "error": info.error,
-                "timestamp": datetime.now().isoformat(),
-                "file_path": None,
-                "download_status": "pending",
+                "error": "Platform not supported",
+                "status": "unsupported",
             }
+            continue
 
-            results[platform] = platform_info
-
-            print(f"  ✓ Content ID: {content_id}")
-            print(f"  ✓ Platform: {info.platform}")
-            print(f"  ✓ Title: {info.title[:50] if info.title else 'N/A'}...")
-            print(f"  ✓ Duration: {platform_info['duration_formatted'] or 'N/A'}")
-            print(f"  ✓ Views: {info.view_count or 'N/A'}")
-            print(f"  ✓ Qualities: {len(info.available_qualities)} options")
-
-        except Exception as e:
-            print(f"  ✗ Error: {str(e)}")
+        info = infos[platform]
+        if isinstance(info, Exception):
+            print(f"  ✗ Error: {str(info)}")
             results[platform] = {
                 "content_id": content_id,
                 "user_link": url,
-                "error": str(e),
+                "error": str(info),
                 "status": "error",
             }
+            continue
+
+        platform_info = {
+            "content_id": content_id,
+            "user_link": url,
+            "platform": platform,
+            "platform_detected": info.platform,
+            "title": info.title,
+            "description": info.description,
+            "thumbnail": info.thumbnail,
+            "duration_seconds": info.duration,
+            "duration_formatted": f"{info.duration // 60}:{info.duration % 60:02d}"
+            if info.duration
+            else None,
+            "uploader": info.uploader,
+            "upload_date": info.upload_date,
+            "view_count": info.view_count,
+            "available_qualities": info.available_qualities,
+            "available_formats_count": len(info.available_formats),
+            "is_live": info.is_live,
+            "error": info.error,
+            "timestamp": timestamp,
+            "file_path": None,
+            "download_status": "pending",
+        }
+
+        results[platform] = platform_info
+
+        print(f"  ✓ Content ID: {content_id}")
+        print(f"  ✓ Platform: {info.platform}")
+        print(f"  ✓ Title: {info.title[:50] if info.title else 'N/A'}...")
+        print(f"  ✓ Duration: {platform_info['duration_formatted'] or 'N/A'}")
+        print(f"  ✓ Views: {info.view_count or 'N/A'}")
+        print(f"  ✓ Qualities: {len(info.available_qualities)} options")
 
     return results
 
@@ -127,8 +164,8 @@ def test_youtube_download_with_details():
     print("YOUTUBE DOWNLOAD WITH FILE PATH & UNIQUE ID")
     print("=" * 70)
 
+    # The downloader creates its output directory
     downloader = SocialMediaDownloader(output_dir="./downloads")
-    os.makedirs("./downloads", exist_ok=True)
 
     yt_url = TEST_URLS["youtube"]
     content_id = generate_unique_id("youtube_download")
@@ -146,6 +183,8 @@ def test_youtube_download_with_details():
         # Download
         print("\nDownloading at 360p quality...")
         result = downloader.download(url=yt_url, quality="360p", format_name="mp4")
+        abs_path = os.path.abspath(result.file_path) if result.file_path else None
+        size_mb = _mb(result.file_size)
 
         # Build complete response
         download_result = {
@@ -156,16 +195,10 @@ def test_youtube_download_with_details():
             "platform": result.platform,
             "title": result.title,
             "file_path": result.file_path,
-            "file_path_absolute": os.path.abspath(result.file_path)
-            if result.file_path
-            else None,
+            "file_path_absolute": abs_path,
             "file_size_bytes": result.file_size,
-            "file_size_mb": round(result.file_size / 1024 / 1024, 2)
-            if result.file_size
-            else None,
-            "file_size_human": f"{result.file_size / 1024 / 1024:.2f} MB"
-            if result.file_size
-            else None,
+            "file_size_mb": size_mb,
+            "file_size_human": f"{size_mb:.2f} MB" if size_mb else None,
             "file_format": result.file_format,
             "duration_seconds": result.duration,
             "duration_formatted": f"{result.duration // 60}:{result.duration % 60:02d}"
@@ -177,9 +210,7 @@ def test_youtube_download_with_details():
             "error": result.error,
             "message": result.message,
             "timestamp": datetime.now().isoformat(),
-            "download_url": f"file://{os.path.abspath(result.file_path)}"
-            if result.file_path
-            else None,
+            "download_url": f"file://{abs_path}" if abs_path else None,
             "unique_download_id": f"dl_{result.task_id}_{int(time.time())}",
         }
 
@@ -190,12 +221,16 @@ def test_youtube_download_with_details():
         print(f"  File Size: {download_result['file_size_human']}")
         print(f"  Format: {result.file_format}")
 
-        # Verify file
-        if result.file_path and os.path.exists(result.file_path):
+        # Verify file (one stat; a missing file or path raises)
+        try:
             stat = os.stat(result.file_path)
+        except (FileNotFoundError, TypeError):
+            stat = None
+
+        if stat is not None:
             download_result["file_verified"] = True
             download_result["file_verified_size"] = stat.st_size
-            print(f"  ✓ File verified: {stat.st_size / 1024 / 1024:.2f} MB")
+            print(f"  ✓ File verified: {_mb(stat.st_size) or 0:.2f} MB")
         else:
             download_result["file_verified"] = False
             print(f"  ✗ File not found")
@@ -204,9 +239,10 @@ def test_youtube_download_with_details():
 
     except Exception as e:
         print(f"✗ Error: {str(e)}")
-        import traceback
+        if _DEBUG_TRACE:
+            import traceback
 
-        traceback.print_exc()
+            traceback.print_exc()
         return {
             "content_id": content_id,
             "user_link": yt_url,
@@ -215,87 +251,94 @@ def test_youtube_download_with_details():
         }
 
 
-def test_api_endpoints():
+async def test_api_endpoints():
     """Test all API endpoints"""
     print("\n" + "=" * 70)
     print("API ENDPOINTS TEST")
     print("=" * 70)
 
     try:
-        from fastapi.testclient import TestClient
+        from httpx import ASGITransport, AsyncClient
         from src.api.app import app
 
-        client = TestClient(app)
-        results = {}
-
-        # 1. Health
-        print("\n[1] Health Check:")
-        response = client.get("/api/health")
-        results["health"] = response.json()
-        print(f"    Status: {results['health']['status']}")
-
-        # 2. Platforms
-        print("\n[2] Supported Platforms:")
-        response = client.get("/api/platforms")
-        results["platforms"] = response.json()
-        print(f"    Platforms: {results['platforms']['platforms']}")
-
-        # 3. Qualities
-        print("\n[3] Quality Options:")
-        response = client.get("/api/qualities")
-        results["qualities"] = response.json()
-        print(f"    Total: {len(results['qualities'])} options")
-
-        # 4. Video Info with Content ID
-        print("\n[4] Video Info (YouTube):")
-        yt_url = TEST_URLS["youtube"]
-        content_id = generate_unique_id("api_video_info")
-        response = client.get(f"/api/info?url={yt_url}")
-        results["video_info"] = response.json()
-        results["video_info"]["content_id"] = content_id
-        results["video_info"]["user_link"] = yt_url
-        print(f"    Content ID: {content_id}")
-        print(f"    Title: {results['video_info']['title'][:40]}...")
-        print(f"    Platform: {results['video_info']['platform']}")
-
-        # 5. Download with Content ID
-        print("\n[5] Download (YouTube):")
-        download_content_id = generate_unique_id("api_download")
-        response = client.post(
-            "/api/download", json={"url": yt_url, "quality": "360p", "format": "mp4"}
-        )
-        results["download"] = response.json()
-        results["download"]["content_id"] = download_content_id
-        results["download"]["user_link"] = yt_url
-        print(f"    Content ID: {download_content_id}")
-        print(f"    Task ID: {results['download']['task_id']}")
-        print(f"    Status: {results['download']['status']}")
-
-        # 6. Progress
-        if results["download"]["task_id"]:
-            print("\n[6] Progress Check:")
-            progress_content_id = generate_unique_id("api_progress")
-            response = client.get(
-                f"/api/download/progress/{results['download']['task_id']}"
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            # Read-only endpoints are independent, so fetch them together
+            yt_url = TEST_URLS["youtube"]
+            state, qualities, info = await asyncio.gather(
+                client.get("/api/state"),
+                client.get("/api/qualities"),
+                client.get(f"/api/info?url={yt_url}"),
             )
-            results["progress"] = response.json()
-            results["progress"]["content_id"] = progress_content_id
-            print(f"    Content ID: {progress_content_id}")
-            print(f"    Progress: {results['progress']['progress_percent']}%")
-
-        # 7. History
-        print("\n[7] History:")
-        response = client.get("/api/history")
-        results["history"] = response.json()
-        print(f"    Total Items: {results['history']['total_count']}")
+            state = state.json()
+            results = {}
+
+            # 1. Health
+            print("\n[1] Health Check:")
+            results["health"] = state["health"]
+            print(f"    Status: {results['health']['status']}")
+
+            # 2. Platforms
+            print("\n[2] Supported Platforms:")
+            results["platforms"] = {"platforms": state["platforms"]}
+            print(f"    Platforms: {results['platforms']['platforms']}")
+
+            # 3. Qualities
+            print("\n[3] Quality Options:")
+            results["qualities"] = qualities.json()
+            print(f"    Total: {len(results['qualities'])} options")
+
+            # 4. Video Info with Content ID
+            print("\n[4] Video Info (YouTube):")
+            content_id = generate_unique_id("api_video_info")
+            results["video_info"] = info.json()
+            results["video_info"]["content_id"] = content_id
+            results["video_info"]["user_link"] = yt_url
+            print(f"    Content ID: {content_id}")
+            print(f"    Title: {results['video_info']['title'][:40]}...")
+            print(f"    Platform: {results['video_info']['platform']}")
+
+            # 5. Download with Content ID
+            print("\n[5] Download (YouTube):")
+            download_content_id = generate_unique_id("api_download")
+            response = await client.post(
+                "/api/download", json={"url": yt_url, "quality": "360p", "format": "mp4"}
+            )
+            results["download"] = response.json()
+            results["download"]["content_id"] = download_content_id
+            results["download"]["user_link"] = yt_url
+            print(f"    Content ID: {download_content_id}")
+            print(f"    Task ID: {results['download']['task_id']}")
+            print(f"    Status: {results['download']['status']}")
+
+            task_id = results["download"]["task_id"]
+            pending = [client.get("/api/state")]
+            if task_id:
+                pending.append(client.get(f"/api/download/progress/{task_id}"))
+            state, *progress = await asyncio.gather(*pending)
+
+            # 6. Progress
+            if progress:
+                print("\n[6] Progress Check:")
+                progress_content_id = generate_unique_id("api_progress")
+                results["progress"] = progress[0].json()
+                results["progress"]["content_id"] = progress_content_id
+                print(f"    Content ID: {progress_content_id}")
+                print(f"    Progress: {results['progress']['progress_percent']}%")
+
+            # 7. History
+            print("\n[7] History:")
+            results["history"] = state.json()["history"]
+            print(f"    Total Items: {results['history']['total_count']}")
 
         return results
 
     except Exception as e:
         print(f"✗ Error: {str(e)}")
-        import traceback
+        if _DEBUG_TRACE:
+            import traceback
 
-        traceback.print_exc()
+            traceback.print_exc()
         return None
 
 
@@ -321,7 +364,7 @@ def generate_final_report(all_results):
     # Save report
     report_file = "full_test_report.json"
     with open(report_file, "w") as f:
-        json.dump(report, f, indent=2, default=str)
+        f.write(format_json(report))
 
     print(f"\n✓ Report saved: {report_file}")
 
@@ -334,7 +377,7 @@ def generate_final_report(all_results):
     api_dl = all_results.get("api_endpoints", {}).get("download", {})
 
     print(
-        json.dumps(
+        format_json(
             {
                 "youtube_download": {
                     "content_id": yt_download.get("content_id"),
@@ -353,8 +396,7 @@ def generate_final_report(all_results):
                     "file_path": api_dl.get("file_path"),
                     "status": api_dl.get("status"),
                 },
-            },
-            indent=2,
+            }
         )
     )
 
@@ -374,13 +416,13 @@ def main():
     results["platform_detection"] = test_platform_detection()
 
     # Test 2: Video Info (All Platforms)
-    results["video_info"] = test_video_info_all_platforms()
+    results["video_info"] = asyncio.run(test_video_info_all_platforms())
 
     # Test 3: YouTube Download with Details
     results["youtube_download"] = test_youtube_download_with_details()
 
     # Test 4: API Endpoints
-    results["api_endpoints"] = test_api_endpoints()
+    results["api_endpoints"] = asyncio.run(test_api_endpoints())
 
     # Generate Report
     report = generate_final_report(results)
@@ -0,0 +1,43 @@
+"""Shared constants and helpers for the test scripts"""
+
+import sys
+from functools import lru_cache
+
+# PSY - Gangnam Style, used as the default YouTube test video
+TEST_YT_URL = "https://www.youtube.com/watch?v=9bZkp7q19f0"
+
+# Me at the zoo (19s), fetched once to warm yt-dlp before timed checks
+WARMUP_URL = "https://www.youtube.com/watch?v=jNQXAC9IVRw"
+
+
+@lru_cache(maxsize=64)
+def platform(url):
+    """Detect the platform of a test URL, once per URL"""
+    from src.core.url_detector import detect_platform
+
+    return detect_platform(url)
+
+
+def warmup():
+    """Prime yt-dlp's player-JS cache so timed checks see steady-state latency"""
+    from src.core.downloader import SocialMediaDownloader
+
+    try:
+        SocialMediaDownloader().get_video_info(WARMUP_URL)
+    except Exception as e:
+        print(f"Warmup skipped: {e}")
+
+
+class Printer:
+    """Collects a test's output lines and writes them with one call"""
+
+    def __init__(self):
+        self.lines = []
+
+    def p(self, text=""):
+        self.lines.append(text)
+
+    def flush(self):
+        if self.lines:
+            sys.stdout.write("\n".join(self.lines) + "\n")
+            self.lines.clear()
@@ -0,0 +1,31 @@
+"""Shared pytest fixtures"""
+
+import os
+import socket
+import sys
+
+import pytest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The API modules import `core`/`utils` as top-level packages
+for path in (PROJECT_ROOT, os.path.join(PROJECT_ROOT, "src")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The FastAPI app, imported (routes and models built) once per session"""
+    from src.api.app import app
+
+    return app
+
+
+@pytest.fixture(scope="session")
+def network():
+    """Skip tests that need YouTube when it cannot be reached"""
+    try:
+        socket.create_connection(("www.youtube.com", 443), timeout=3).close()
+    except OSError as e:
+        pytest.skip(f"network unavailable: {e}")
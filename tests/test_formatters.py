@@ -0,0 +1,71 @@
+"""Tests for response formatting utilities"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+import pytest
+
+from src.core.url_detector import Platform
+from src.utils import formatters
+
+
+@dataclass
+class _Row:
+    score: float
+    platform: Platform
+
+
+_REPORT = {
+    'platform': Platform.YOUTUBE,
+    'row': _Row(float('nan'), Platform.FACEBOOK),
+    'ratio': float('inf'),
+    'title': 'Café ✓',
+    'started': datetime(2026, 1, 2, 3, 4, 5),
+    'sizes': (1, 2.5, [float('nan')]),
+}
+
+
+def test_format_json_same_without_orjson(monkeypatch):
+    """format_json output does not depend on orjson being installed"""
+    if formatters.orjson is None:
+        pytest.skip("orjson not installed")
+    fast = formatters.format_json(_REPORT)
+    monkeypatch.setattr(formatters, "orjson", None)
+
+    assert formatters.format_json(_REPORT) == fast
+    assert '"platform": "youtube"' in fast
+    assert '"title": "Café ✓"' in fast
+
+
+_PROGRESS = ((0, 100), (33, 100), (50, 100), (100, 100), (150, 100), (-5, 100), (7, 0), (1.5, 3.0))
+
+
+@pytest.mark.parametrize("width,fill,empty", ((30, "█", "░"), (7, "#", "-")))
+def test_progress_batch_matches_single(width, fill, empty):
+    """format_progress_batch gives the same bars as format_progress_bar"""
+    currents, totals = zip(*_PROGRESS)
+    expected = [
+        formatters.format_progress_bar(current, total, width, fill, empty)
+        for current, total in _PROGRESS
+    ]
+
+    assert formatters.format_progress_batch(list(currents), list(totals), width, fill, empty) == expected
+
+
+@pytest.mark.parametrize("max_length", (3, 5, 10, 50))
+def test_truncate_many_matches_single(max_length):
+    """truncate_many truncates each text like truncate_text"""
+    texts = ["", "abc", "abcde", "a" * 10, "Café ✓ " * 10]
+
+    assert formatters.truncate_many(texts, max_length) == [
+        formatters.truncate_text(text, max_length) for text in texts
+    ]
+
+
+def test_table_row_formatter_matches_single():
+    """A prebuilt row formatter formats rows like format_table_row"""
+    widths = [3, 8, 1]
+    format_row = formatters.make_table_row_formatter(widths)
+
+    for row in (["", "", ""], ["abcdef", "short", "xy"], ["a", "Café ✓ long text", "z"]):
+        assert format_row(row) == formatters.format_table_row(row, widths)
@@ -0,0 +1,140 @@
+"""Tests for platform handlers"""
+
+import asyncio
+import threading
+import time
+import types
+
+import pytest
+import yt_dlp
+
+from src.platforms import base
+from src.platforms.youtube import YouTubeHandler
+
+
+_BATCH_URLS = tuple(
+    f"https://www.youtube.com/watch?v=vid{i:08d}" for i in range(8)
+)
+
+
+class _FakeYoutubeDL:
+    """Stand-in for YoutubeDL that fails on overlapping use of one instance"""
+
+    threads = {}
+
+    def __init__(self, params=None):
+        self.busy = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def close(self):
+        pass
+
+    def extract_info(self, url, download=True):
+        assert not self.busy, "YoutubeDL instance used concurrently"
+        self.busy = True
+        _FakeYoutubeDL.threads.setdefault(id(self), set()).add(threading.get_ident())
+        time.sleep(0.01)
+        self.busy = False
+        return {'title': url.rsplit('=', 1)[1]}
+
+
+@pytest.fixture
+def fake_ydl(monkeypatch):
+    _FakeYoutubeDL.threads = {}
+    base._clear_ydl_cache()
+    monkeypatch.setattr(yt_dlp, "YoutubeDL", _FakeYoutubeDL)
+    yield _FakeYoutubeDL
+    # Don't leave fakes cached for later tests on this thread
+    base._clear_ydl_cache()
+
+
+def test_batch_workers_do_not_share_youtubedl(fake_ydl):
+    """Each batch worker thread extracts with its own YoutubeDL"""
+    infos = YouTubeHandler().get_video_info_batch(list(_BATCH_URLS), max_workers=4)
+
+    assert [info.title for info in infos] == [url.rsplit('=', 1)[1] for url in _BATCH_URLS]
+    assert all(len(threads) == 1 for threads in fake_ydl.threads.values())
+
+
+def test_async_batch_workers_do_not_share_youtubedl(fake_ydl):
+    """The async batch gives every worker thread its own YoutubeDL too"""
+    handler = YouTubeHandler()
+    infos = asyncio.run(handler.get_video_info_batch_async(list(_BATCH_URLS), max_workers=4))
+
+    assert [info.title for info in infos] == [url.rsplit('=', 1)[1] for url in _BATCH_URLS]
+    assert all(len(threads) == 1 for threads in fake_ydl.threads.values())
+
+
+def test_info_cache_is_bounded_and_drops_expired(fake_ydl, monkeypatch):
+    """The handler info cache holds at most its maxsize and evicts expired entries"""
+    monkeypatch.setattr(base, "_INFO_CACHE_MAXSIZE", 4)
+    clock = types.SimpleNamespace(monotonic=lambda: 1000.0)
+    monkeypatch.setattr(base, "time", clock)
+    handler = YouTubeHandler(cache_ttl_seconds=60)
+    for url in _BATCH_URLS:
+        handler.get_video_info(url)
+    assert len(handler._info_cache) == 4
+
+    clock.monotonic = lambda: 1061.0
+    handler.get_video_info(_BATCH_URLS[0])
+    assert list(handler._info_cache) == [handler._cache_key(_BATCH_URLS[0])]
+
+
+def test_cache_key_keeps_playlist_apart():
+    """A video opened from a playlist is not cached as the plain video"""
+    handler = YouTubeHandler()
+    video = handler._cache_key("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+
+    assert handler._cache_key("https://youtu.be/dQw4w9WgXcQ?si=abc") == video
+    assert handler._cache_key(
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ&list=PL123"
+    ) != video
+
+
+@pytest.mark.parametrize("url,downloads", (
+    ("https://www.youtube.com/live/abc?si=a&list=PL123", False),
+    ("https://www.youtube.com/live/abc", True),
+    ("https://www.youtube.com/shorts/abc?x=1&list=PL123", True),
+    ("https://www.youtube.com/playlist?list=PL123", False),
+    ("https://www.youtube.com/watch?v=abc", False),
+))
+def test_special_content_precedence(url, downloads, monkeypatch):
+    """With several special tokens the first one in special_paths decides"""
+    handler = YouTubeHandler()
+    calls = []
+    monkeypatch.setattr(handler, "download", lambda url, quality: calls.append(url))
+
+    handler.handle_special_content(url)
+
+    assert calls == ([url] if downloads else [])
+
+
+def test_download_options_do_not_share_headers():
+    """Headers added by one caller don't leak into later downloads"""
+    from src.platforms.facebook import FacebookHandler
+
+    handler = FacebookHandler()
+    first = handler.get_download_options('720p')
+    first['http_headers']['Cookie'] = 'session=1'
+
+    second = handler.get_download_options('720p')
+    assert second['http_headers'] is not first['http_headers']
+    assert 'Cookie' not in second['http_headers']
+    assert type(second['http_headers']) is dict
+
+
+def test_evicted_youtubedl_instances_are_closed(fake_ydl, monkeypatch):
+    """Instances pushed out of the per-thread cache are closed"""
+    closed = []
+    monkeypatch.setattr(fake_ydl, "close", lambda self: closed.append(self), raising=False)
+
+    first = base._ydl_for(frozenset({('quiet', True), ('n', 0)}))
+    for n in range(1, base._YDL_PER_THREAD + 1):
+        base._ydl_for(frozenset({('quiet', True), ('n', n)}))
+
+    assert closed == [first]
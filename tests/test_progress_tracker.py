@@ -0,0 +1,80 @@
+"""Tests for the progress tracker"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from src.core.progress_tracker import DownloadStatus, ProgressTracker
+
+
+def test_removed_progress_is_not_reused():
+    """A caller holding a removed task's progress never sees another task"""
+    tracker = ProgressTracker()
+    held = tracker.create_task("old", "https://youtu.be/a", "youtube")
+    tracker.set_complete("old", file_path="/tmp/a.mp4")
+    tracker.clear_completed()
+    tracker.remove_task("old")
+
+    fresh = tracker.create_task("new", "https://youtu.be/b", "youtube")
+
+    assert fresh is not held
+    assert (held.task_id, held.status, held.file_path) == (
+        "old", DownloadStatus.COMPLETED, "/tmp/a.mp4"
+    )
+    assert tracker.get_progress("new").url == "https://youtu.be/b"
+
+
+def test_every_change_moves_the_version():
+    """Creating, updating, finishing and removing a task all bump the version"""
+    tracker = ProgressTracker()
+    seen = [tracker.get_version()]
+    steps = (
+        lambda: tracker.create_task("t1", "https://youtu.be/a", "youtube"),
+        lambda: tracker.update_progress("t1", progress_percent=50.0),
+        lambda: tracker.set_complete("t1"),
+        lambda: tracker.remove_task("t1"),
+    )
+    for step in steps:
+        step()
+        seen.append(tracker.get_version())
+
+    assert seen == sorted(set(seen))
+
+    tracker.update_progress("missing", progress_percent=1.0)
+    tracker.remove_task("missing")
+    assert tracker.get_version() == seen[-1]
+
+
+def test_iter_since_returns_only_changed_tasks():
+    """iter_since lists the live tasks changed after the given version"""
+    tracker = ProgressTracker()
+    for task_id in ("a", "b", "c"):
+        tracker.create_task(task_id, f"https://youtu.be/{task_id}", "youtube")
+    version = tracker.get_version()
+    assert tracker.iter_since(version) == {}
+
+    tracker.update_progress("b", progress_percent=10.0)
+    tracker.remove_task("c")
+
+    changed = tracker.iter_since(version)
+    assert list(changed) == ["b"]
+    assert changed["b"].progress_percent == 10.0
+    assert tracker.get_version() > version
+    assert set(tracker.iter_since(0)) == {"a", "b"}
+
+
+def test_concurrent_updates_get_distinct_versions():
+    """Versions issued from several threads never collide"""
+    tracker = ProgressTracker()
+    task_ids = [f"task{i}" for i in range(32)]
+    for task_id in task_ids:
+        tracker.create_task(task_id, "https://youtu.be/x", "youtube")
+
+    def tick(task_id):
+        for percent in range(100):
+            tracker.update_progress(task_id, progress_percent=float(percent))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(tick, task_ids))
+
+    versions = [p.version for p in tracker.get_all_progress().values()]
+    assert len(set(versions)) == len(task_ids)
+    assert tracker.get_version() == max(versions)
@@ -0,0 +1,58 @@
+"""Tests for the zero-copy file responses"""
+
+import asyncio
+import os
+
+from src.api.responses import ZEROCOPY_EXTENSION, ZeroCopyFileResponse
+
+
+_BODY = b"zero-copy body " * 1024
+
+
+def _serve(response, extensions):
+    """Call a response like a server would, returning the sent messages"""
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "headers": [],
+        "extensions": extensions,
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == ZEROCOPY_EXTENSION:
+            # Read through the descriptor while the response keeps it open
+            fd = message["file"].fileno()
+            message = dict(message, data=os.pread(fd, message["count"], 0))
+        messages.append(message)
+
+    asyncio.run(response(scope, receive, send))
+    return messages
+
+
+def test_zerocopy_sends_file_object(tmp_path):
+    """A server advertising the extension gets the open file, not its bytes"""
+    path = tmp_path / "video.mp4"
+    path.write_bytes(_BODY)
+
+    start, body = _serve(ZeroCopyFileResponse(path), {ZEROCOPY_EXTENSION: {}})
+
+    assert start["status"] == 200
+    assert (b"content-length", str(len(_BODY)).encode()) in start["headers"]
+    assert body["type"] == ZEROCOPY_EXTENSION
+    assert body["count"] == len(_BODY) and body["data"] == _BODY
+    assert body["file"].closed
+
+
+def test_zerocopy_falls_back_without_extension(tmp_path):
+    """Servers without the extension get the regular streamed body"""
+    path = tmp_path / "video.mp4"
+    path.write_bytes(_BODY)
+
+    messages = _serve(ZeroCopyFileResponse(path), {})
+
+    assert messages[0]["status"] == 200
+    assert b"".join(m.get("body", b"") for m in messages[1:]) == _BODY
@@ -0,0 +1,65 @@
+"""Tests for API route helpers"""
+
+import asyncio
+import threading
+
+from httpx import ASGITransport, AsyncClient
+
+from src.api import routes
+from src.api.routes import _scan_downloads
+
+
+def test_scan_downloads_sees_files_growing_in_place(tmp_path):
+    """Appending to a file updates its size without a directory change"""
+    part = tmp_path / "video.mp4.part"
+    part.write_bytes(b"x" * 10)
+    assert [f["size_bytes"] for f in _scan_downloads(tmp_path)] == [10]
+
+    with open(part, "ab") as f:
+        f.write(b"x" * 20)
+
+    assert [f["size_bytes"] for f in _scan_downloads(tmp_path)] == [30]
+
+
+def test_scan_downloads_missing_directory(tmp_path):
+    """A downloads directory that does not exist yet lists as None"""
+    assert _scan_downloads(tmp_path / "missing") is None
+
+
+def test_info_requests_run_concurrently(app, monkeypatch):
+    """Blocking metadata lookups run off the event loop, so requests overlap"""
+    from src.core.downloader import VideoInfo
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    def get_video_info(url, use_cache=True):
+        # Both lookups must be in flight at once to get past the barrier
+        barrier.wait()
+        return VideoInfo(url=url, platform="youtube", title="t")
+
+    monkeypatch.setattr(routes.get_downloader(), "get_video_info", get_video_info)
+
+    async def run():
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+            return await asyncio.gather(*(
+                c.get("/api/info", params={"url": f"https://youtu.be/{vid}"})
+                for vid in ("a", "b")
+            ))
+
+    assert [r.status_code for r in asyncio.run(run())] == [200, 200]
+
+
+def test_state_files_match_files_endpoint(app, tmp_path, monkeypatch):
+    """The files section of /api/state has the same shape as /api/files"""
+    (tmp_path / "downloads").mkdir()
+    (tmp_path / "downloads" / "video.mp4").write_bytes(b"x" * 10)
+    monkeypatch.setattr(routes, "PROJECT_ROOT", tmp_path)
+
+    async def run():
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+            return await asyncio.gather(c.get("/api/files"), c.get("/api/state"))
+
+    files, state = asyncio.run(run())
+
+    assert state.json()["files"] == files.json()
+    assert files.json()["downloads_dir"] == str(tmp_path / "downloads")